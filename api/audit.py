@@ -2,10 +2,17 @@
 Audit logging utilities for tracking critical actions.
 """
 
+import threading
+
+from django.db import transaction
 from django.http import HttpRequest
 from .models import AuditLog, AcaoAuditoriaChoices, Usuario, Evento, Inscricao, Certificado
 
 
+# Active AuditBatch for the current thread, if any
+_batch_state = threading.local()
+
+
 def get_client_ip(request: HttpRequest) -> str:
     """Extract client IP from request."""
     x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
@@ -52,24 +59,75 @@ def log_action(
         if not usuario and hasattr(request, 'user') and request.user.is_authenticated:
             usuario = request.user
     
+    entry = AuditLog(
+        acao=acao,
+        usuario=usuario,
+        usuario_afetado=usuario_afetado,
+        evento=evento,
+        inscricao=inscricao,
+        certificado=certificado,
+        descricao=descricao,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        dados_extras=dados_extras
+    )
+
+    batch = getattr(_batch_state, "current", None)
+    if batch is not None:
+        batch.add(entry)
+        return
+
     try:
-        AuditLog.objects.create(
-            acao=acao,
-            usuario=usuario,
-            usuario_afetado=usuario_afetado,
-            evento=evento,
-            inscricao=inscricao,
-            certificado=certificado,
-            descricao=descricao,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            dados_extras=dados_extras
-        )
+        entry.save(force_insert=True)
     except Exception as e:
         # Log errors but don't break the application
         print(f"Erro ao registrar auditoria: {e}")
 
 
+class AuditBatch:
+    """
+    Buffer every log_action() call made inside the block and insert them with
+    a single bulk_create once the surrounding transaction commits.
+
+    Usage:
+        with AuditBatch():
+            ...  # saves whose signals / explicit log_* calls produce entries
+
+    Nested batches hand their entries to the outermost one.
+    """
+
+    batch_size = 500
+
+    def __init__(self):
+        self.entries: list[AuditLog] = []
+        self._parent = None
+
+    def add(self, entry: AuditLog):
+        self.entries.append(entry)
+
+    def __enter__(self):
+        self._parent = getattr(_batch_state, "current", None)
+        _batch_state.current = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _batch_state.current = self._parent
+        entries, self.entries = self.entries, []
+        if self._parent is not None:
+            self._parent.entries.extend(entries)
+        elif entries:
+            # Runs immediately in autocommit mode; dropped with a rolled-back transaction
+            transaction.on_commit(lambda: self._flush(entries))
+        return False
+
+    def _flush(self, entries: list[AuditLog]):
+        try:
+            AuditLog.objects.bulk_create(entries, batch_size=self.batch_size)
+        except Exception as e:
+            # Log errors but don't break the application
+            print(f"Erro ao registrar auditoria: {e}")
+
+
 # Convenience functions for specific actions
 
 def log_usuario_criado(request, usuario_criado: Usuario, criado_por: Usuario = None):
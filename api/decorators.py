@@ -1,14 +1,21 @@
 from functools import wraps
 from django.contrib.auth.decorators import login_required
+from django.http import HttpResponseForbidden
 from django.shortcuts import redirect
 from django.contrib import messages
 from .models import PerfilChoices
 
 
-def perfil_required(*perfis_permitidos):
+def perfil_required(*perfis_permitidos, owner_check=None):
     """
     Decorator to restrict view access based on user profile.
     Usage: @perfil_required(PerfilChoices.ADMIN, PerfilChoices.ORGANIZADOR)
+
+    owner_check, if given, is called as owner_check(request, *args, **kwargs)
+    after the profile check and must return True for the view to run. Keep it
+    to a cheap query so unauthorized requests bail before any view setup.
+    A failed owner check answers 403 directly: no flash message, no session
+    write and no dashboard render.
     """
     def decorator(view_func):
         @wraps(view_func)
@@ -22,6 +29,9 @@ def perfil_required(*perfis_permitidos):
                 messages.error(request, "Você não tem permissão para acessar esta página.")
                 return redirect('dashboard')
             
+            if owner_check is not None and not owner_check(request, *args, **kwargs):
+                return HttpResponseForbidden("Sem permissão.")
+            
             return view_func(request, *args, **kwargs)
         return _wrapped_view
     return decorator
@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2025-12-08 10:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_remove_certificado_api_certifi_codigo_d298cd_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='inscricao',
+            name='api_inscric_evento__09faa0_idx',
+        ),
+        migrations.AddIndex(
+            model_name='inscricao',
+            index=models.Index(fields=['evento', 'status', 'presenca_confirmada'], name='api_inscric_evento__027518_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inscricao',
+            index=models.Index(fields=['status', 'presenca_confirmada', '-data_inscricao'], name='api_inscric_status_1b9027_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2025-12-08 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_remove_inscricao_api_inscric_evento__09faa0_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usuario',
+            index=models.Index(fields=['email'], name='api_usuario_email_30f64d_idx'),
+        ),
+    ]
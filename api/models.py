@@ -50,6 +50,7 @@ class Usuario(AbstractUser):
         ]
         indexes = [
             models.Index(fields=["perfil"]),
+            models.Index(fields=["email"]),
         ]
 
     def clean(self):
@@ -138,6 +139,10 @@ class Evento(models.Model):
     @property
     def total_inscritos(self) -> int:
         """Return total number of confirmed registrants."""
+        # Use the count annotated by the query when available
+        confirmadas = getattr(self, "confirmadas", None)
+        if confirmadas is not None:
+            return confirmadas
         return self.inscricoes.filter(status=InscricaoStatus.CONFIRMADA).count()
 
     @property
@@ -174,8 +179,9 @@ class Inscricao(models.Model):
     class Meta:
         unique_together = ("evento", "participante")
         indexes = [
-            models.Index(fields=["evento", "status"]),
+            models.Index(fields=["evento", "status", "presenca_confirmada"]),
             models.Index(fields=["participante"]),
+            models.Index(fields=["status", "presenca_confirmada", "-data_inscricao"]),
         ]
         constraints = [
             models.CheckConstraint(
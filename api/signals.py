@@ -1,9 +1,12 @@
+from contextlib import contextmanager
+
 from django.db.models.signals import post_save, post_delete, pre_save
 from django.contrib.auth.signals import user_logged_in
 from django.dispatch import receiver
 from .models import Usuario, Evento, Inscricao, Certificado, AcaoAuditoriaChoices, InscricaoStatus
 from .audit import log_action
 from .emails import enviar_email_inscricao
+from .tasks import run_in_background
 
 @receiver(user_logged_in)
 def log_user_login(sender, request, user, **kwargs):
@@ -38,14 +41,14 @@ def log_evento_save(sender, instance, created, **kwargs):
 
 @receiver(pre_save, sender=Inscricao)
 def capture_inscricao_pre_save(sender, instance, **kwargs):
+    instance._old_status = None
+    instance._old_presenca = False
     if instance.pk:
-        try:
-            old_instance = Inscricao.objects.get(pk=instance.pk)
-            instance._old_status = old_instance.status
-        except Inscricao.DoesNotExist:
-            instance._old_status = None
-    else:
-        instance._old_status = None
+        anterior = Inscricao.objects.filter(pk=instance.pk).values_list(
+            "status", "presenca_confirmada"
+        ).first()
+        if anterior:
+            instance._old_status, instance._old_presenca = anterior
 
 @receiver(post_save, sender=Inscricao)
 def log_inscricao_save(sender, instance, created, **kwargs):
@@ -59,7 +62,7 @@ def log_inscricao_save(sender, instance, created, **kwargs):
         )
         # Se criada já como confirmada, envia email
         if instance.status == InscricaoStatus.CONFIRMADA:
-            enviar_email_inscricao(instance)
+            run_in_background(enviar_email_inscricao, instance)
     else:
         # Log status changes if needed, or generic update
         log_action(
@@ -73,7 +76,7 @@ def log_inscricao_save(sender, instance, created, **kwargs):
         # Verifica mudança de status para CONFIRMADA
         if hasattr(instance, '_old_status'):
             if instance._old_status != InscricaoStatus.CONFIRMADA and instance.status == InscricaoStatus.CONFIRMADA:
-                enviar_email_inscricao(instance)
+                run_in_background(enviar_email_inscricao, instance)
 
 @receiver(post_save, sender=Certificado)
 def log_certificado_save(sender, instance, created, **kwargs):
@@ -85,3 +88,31 @@ def log_certificado_save(sender, instance, created, **kwargs):
             evento=instance.inscricao.evento,
             descricao=f"Certificado gerado para {instance.inscricao.participante.nome} no evento {instance.inscricao.evento.titulo}"
         )
+
+
+# Model receivers above, as (signal, receiver, sender) for desativar_sinais.
+_RECEPTORES_MODELOS = (
+    (post_save, log_user_creation, Usuario),
+    (post_save, log_evento_save, Evento),
+    (pre_save, capture_inscricao_pre_save, Inscricao),
+    (post_save, log_inscricao_save, Inscricao),
+    (post_save, log_certificado_save, Certificado),
+)
+
+
+@contextmanager
+def desativar_sinais():
+    """
+    Temporarily disconnect the model receivers (audit log, e-mails).
+
+    Meant for bulk loads such as the sample data scripts, where per-row
+    auditing and notifications are pure overhead. Receivers are reconnected
+    on exit, even if the block raises.
+    """
+    for sinal, receptor, sender in _RECEPTORES_MODELOS:
+        sinal.disconnect(receptor, sender=sender)
+    try:
+        yield
+    finally:
+        for sinal, receptor, sender in _RECEPTORES_MODELOS:
+            sinal.connect(receptor, sender=sender)
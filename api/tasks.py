@@ -0,0 +1,30 @@
+"""
+Background execution for slow work that does not affect the HTTP response.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections, transaction
+
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="aegs-tasks")
+
+
+def _run(func, args, kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception as e:
+        # Log errors but don't break the worker thread
+        print(f"Erro ao executar tarefa '{func.__name__}': {e}")
+    finally:
+        close_old_connections()
+
+
+def run_in_background(func, *args, **kwargs):
+    """
+    Schedule func(*args, **kwargs) on the background worker pool.
+
+    The task is submitted only after the current transaction commits, so it
+    never observes (or acts on) rows that end up rolled back.
+    """
+    transaction.on_commit(lambda: _executor.submit(_run, func, args, kwargs))
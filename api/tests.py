@@ -1,7 +1,14 @@
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 
+from .audit import AuditBatch
 from .models import (
+	AcaoAuditoriaChoices,
+	AuditLog,
 	Certificado,
 	Evento,
 	Inscricao,
@@ -10,6 +17,8 @@ from .models import (
 	TipoEventoChoices,
 	Usuario,
 )
+from .signals import desativar_sinais
+from .views import _MAX_IMAGE_BYTES, _validate_image_file
 
 
 class ModeloTestCase(TestCase):
@@ -113,3 +122,305 @@ class ModeloTestCase(TestCase):
 			emitido_por=self.admin,
 			carga_horaria=4,
 		)
+
+
+class OrganizadorTestCase(TestCase):
+	# Shared fixture: the organizer is created once per class, not per test
+	@classmethod
+	def setUpTestData(cls):
+		cls.organizador = Usuario.objects.create_user(
+			username="organizer",
+			password="SenhaSegura!1",
+			nome="Organizador Chefe",
+			telefone="61999990000",
+			perfil=PerfilChoices.ORGANIZADOR,
+		)
+
+
+class EventoPermissaoViewTestCase(OrganizadorTestCase):
+	def setUp(self):
+		self.outro_organizador = Usuario.objects.create_user(
+			username="outro_organizer",
+			password="SenhaSegura!2",
+			nome="Outro Organizador",
+			telefone="61999991111",
+			perfil=PerfilChoices.ORGANIZADOR,
+		)
+		self.evento = Evento.objects.create(
+			tipo=TipoEventoChoices.PALESTRA,
+			data_inicio="2025-10-10",
+			data_fim="2025-10-11",
+			local="Auditório Central",
+			capacidade=10,
+			organizador=self.organizador,
+		)
+
+	def test_organizador_edita_proprio_evento(self):
+		self.client.force_login(self.organizador)
+		response = self.client.get(reverse("editar-evento", args=[self.evento.pk]))
+		self.assertEqual(response.status_code, 200)
+
+	def test_evento_de_outro_organizador_nao_encontrado(self):
+		self.client.force_login(self.outro_organizador)
+		for url_name in ("editar-evento", "deletar-evento"):
+			response = self.client.get(reverse(url_name, args=[self.evento.pk]))
+			self.assertEqual(response.status_code, 404)
+
+		response = self.client.post(reverse("deletar-evento", args=[self.evento.pk]))
+		self.assertEqual(response.status_code, 404)
+		self.assertTrue(Evento.objects.filter(pk=self.evento.pk).exists())
+
+
+class PostFeedbackViewTestCase(TestCase):
+	def test_erro_de_login_redireciona_com_feedback(self):
+		url = reverse("login")
+		response = self.client.post(url, {"username": "ninguem", "password": "SenhaErrada!1"})
+		self.assertRedirects(response, url, fetch_redirect_response=False)
+
+		response = self.client.get(url)
+		self.assertEqual(response.context["form_errors"], ["Credenciais inválidas."])
+		self.assertEqual(response.context["form_data"], {"username": "ninguem"})
+
+		# Feedback is shown only once
+		response = self.client.get(url)
+		self.assertNotIn("form_errors", response.context)
+
+
+class AuditBatchTestCase(OrganizadorTestCase):
+	def test_registros_inseridos_apenas_no_commit(self):
+		AuditLog.objects.all().delete()
+		with self.captureOnCommitCallbacks(execute=True) as callbacks:
+			with AuditBatch():
+				for local in ("Sala 1", "Sala 2"):
+					Evento.objects.create(
+						tipo=TipoEventoChoices.PALESTRA,
+						data_inicio="2025-10-10",
+						data_fim="2025-10-11",
+						local=local,
+						capacidade=10,
+						organizador=self.organizador,
+					)
+				self.assertFalse(AuditLog.objects.exists())
+
+		self.assertEqual(len(callbacks), 1)
+		self.assertEqual(
+			AuditLog.objects.filter(acao=AcaoAuditoriaChoices.EVENTO_CRIADO).count(),
+			2,
+		)
+
+
+class DesativarSinaisTestCase(OrganizadorTestCase):
+	def _criar_evento(self):
+		return Evento.objects.create(
+			tipo=TipoEventoChoices.PALESTRA,
+			data_inicio="2025-10-10",
+			data_fim="2025-10-11",
+			local="Sala 1",
+			capacidade=10,
+			organizador=self.organizador,
+		)
+
+	def test_sinais_desligados_apenas_dentro_do_bloco(self):
+		AuditLog.objects.all().delete()
+		with desativar_sinais():
+			self._criar_evento()
+		self.assertFalse(AuditLog.objects.exists())
+
+		self._criar_evento()
+		self.assertEqual(
+			AuditLog.objects.filter(acao=AcaoAuditoriaChoices.EVENTO_CRIADO).count(),
+			1,
+		)
+
+
+class PresencaViewTestCase(OrganizadorTestCase):
+	def setUp(self):
+		self.aluno = Usuario.objects.create_user(
+			username="aluno",
+			password="SenhaSegura!3",
+			nome="Aluno Teste",
+			telefone="61977776666",
+			perfil=PerfilChoices.ALUNO,
+			instituicao="UnB",
+		)
+		self.evento = Evento.objects.create(
+			tipo=TipoEventoChoices.PALESTRA,
+			data_inicio="2025-10-10",
+			data_fim="2025-10-11",
+			local="Auditório Central",
+			capacidade=10,
+			organizador=self.organizador,
+		)
+		self.inscricao = Inscricao.objects.create(
+			evento=self.evento,
+			participante=self.aluno,
+			status=InscricaoStatus.CONFIRMADA,
+		)
+
+	def test_presenca_atualizada_em_lote_com_auditoria(self):
+		self.client.force_login(self.organizador)
+		with self.captureOnCommitCallbacks(execute=True):
+			response = self.client.post(reverse("presenca"), {
+				"evento": self.evento.pk,
+				f"presenca_{self.inscricao.pk}": "on",
+			})
+
+		self.assertEqual(response.status_code, 200)
+		self.inscricao.refresh_from_db()
+		self.assertTrue(self.inscricao.presenca_confirmada)
+		self.assertTrue(
+			AuditLog.objects.filter(
+				acao=AcaoAuditoriaChoices.INSCRICAO_ATUALIZADA,
+				inscricao=self.inscricao,
+			).exists()
+		)
+
+
+class MeusEventosViewTestCase(OrganizadorTestCase):
+	def setUp(self):
+		self.aluno = Usuario.objects.create_user(
+			username="aluno",
+			password="SenhaSegura!3",
+			nome="Aluno Teste",
+			telefone="61977776666",
+			perfil=PerfilChoices.ALUNO,
+			instituicao="UnB",
+		)
+
+	def _inscrever(self, local):
+		evento = Evento.objects.create(
+			tipo=TipoEventoChoices.PALESTRA,
+			data_inicio="2025-10-10",
+			data_fim="2025-10-11",
+			local=local,
+			capacidade=10,
+			organizador=self.organizador,
+		)
+		return Inscricao.objects.create(
+			evento=evento,
+			participante=self.aluno,
+			status=InscricaoStatus.CONFIRMADA,
+			presenca_confirmada=True,
+		)
+
+	def test_numero_de_consultas_independe_das_inscricoes(self):
+		inscricao = self._inscrever("Sala 1")
+		Certificado.objects.create(inscricao=inscricao, emitido_por=self.organizador, carga_horaria=4)
+		self.client.force_login(self.aluno)
+
+		with CaptureQueriesContext(connection) as uma_inscricao:
+			self.client.get(reverse("meus-eventos"))
+
+		for local in ("Sala 2", "Sala 3"):
+			inscricao = self._inscrever(local)
+			Certificado.objects.create(inscricao=inscricao, emitido_por=self.organizador, carga_horaria=4)
+
+		with self.assertNumQueries(len(uma_inscricao)):
+			self.client.get(reverse("meus-eventos"))
+
+
+class CertificadoPDFPermissaoTestCase(OrganizadorTestCase):
+	def setUp(self):
+		self.aluno = Usuario.objects.create_user(
+			username="aluno",
+			password="SenhaSegura!3",
+			nome="Aluno Teste",
+			telefone="61977776666",
+			perfil=PerfilChoices.ALUNO,
+			instituicao="UnB",
+		)
+		self.outro_aluno = Usuario.objects.create_user(
+			username="outro_aluno",
+			password="SenhaSegura!5",
+			nome="Outro Aluno",
+			telefone="61955554444",
+			perfil=PerfilChoices.ALUNO,
+			instituicao="UnB",
+		)
+		evento = Evento.objects.create(
+			tipo=TipoEventoChoices.PALESTRA,
+			data_inicio="2025-10-10",
+			data_fim="2025-10-11",
+			local="Auditório Central",
+			capacidade=10,
+			organizador=self.organizador,
+		)
+		inscricao = Inscricao.objects.create(
+			evento=evento,
+			participante=self.aluno,
+			status=InscricaoStatus.CONFIRMADA,
+			presenca_confirmada=True,
+		)
+		self.certificado = Certificado.objects.create(
+			inscricao=inscricao,
+			emitido_por=self.organizador,
+			carga_horaria=4,
+		)
+		self.url = reverse("gerar-certificado-pdf", args=[self.certificado.pk])
+
+	def test_participante_baixa_proprio_certificado(self):
+		self.client.force_login(self.aluno)
+		response = self.client.get(self.url)
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response["Content-Type"], "application/pdf")
+
+	def test_outro_participante_nao_acessa_certificado(self):
+		self.client.force_login(self.outro_aluno)
+		response = self.client.get(self.url)
+		self.assertEqual(response.status_code, 403)
+
+	def test_certificado_inexistente_retorna_404(self):
+		self.client.force_login(self.aluno)
+		response = self.client.get(reverse("gerar-certificado-pdf", args=[self.certificado.pk + 1]))
+		self.assertEqual(response.status_code, 404)
+
+
+class ValidacaoBannerTestCase(SimpleTestCase):
+	CONTEUDO_IMAGEM = {
+		"test.jpg": (b"\xff\xd8\xff\xe0fake image content", "image/jpeg"),
+		"test.jpeg": (b"\xff\xd8\xff\xe0fake image content", "image/jpeg"),
+		"test.png": (b"\x89PNG\r\n\x1a\nfake image content", "image/png"),
+		"test.gif": (b"GIF89afake image content", "image/gif"),
+		"test.bmp": (b"BMfake image content", "image/bmp"),
+		"test.webp": (b"RIFF\x00\x00\x00\x00WEBPfake image content", "image/webp"),
+		"test.svg": (b'<svg xmlns="http://www.w3.org/2000/svg"></svg>', "image/svg+xml"),
+	}
+
+	def test_imagens_validas_aceitas(self):
+		for nome, (conteudo, content_type) in self.CONTEUDO_IMAGEM.items():
+			with self.subTest(nome=nome):
+				arquivo = SimpleUploadedFile(nome, conteudo, content_type=content_type)
+				self.assertIsNone(_validate_image_file(arquivo))
+
+	def test_extensoes_invalidas_rejeitadas(self):
+		for nome, content_type in (
+			("document.pdf", "application/pdf"),
+			("script.js", "application/javascript"),
+			("data.txt", "text/plain"),
+			("archive.zip", "application/zip"),
+		):
+			with self.subTest(nome=nome):
+				arquivo = SimpleUploadedFile(nome, b"fake content", content_type=content_type)
+				self.assertIsNotNone(_validate_image_file(arquivo))
+
+	def test_conteudo_que_nao_e_imagem_rejeitado(self):
+		arquivo = SimpleUploadedFile("disfarcado.png", b"#!/bin/sh\necho", content_type="image/png")
+		self.assertIsNotNone(_validate_image_file(arquivo))
+
+	def test_xml_sem_extensao_svg_rejeitado(self):
+		arquivo = SimpleUploadedFile("dados.png", b'<?xml version="1.0"?><dados/>', content_type="image/png")
+		self.assertIsNotNone(_validate_image_file(arquivo))
+
+	def test_arquivo_grande_rejeitado_sem_leitura(self):
+		class UploadGrande:
+			name = "large.jpg"
+			content_type = "image/jpeg"
+			size = _MAX_IMAGE_BYTES + 1
+
+			def read(self, *args):
+				raise AssertionError("o conteúdo não deveria ser lido")
+
+		self.assertEqual(_validate_image_file(UploadGrande()), "A imagem deve ter no máximo 5MB.")
+
+	def test_arquivo_ausente_e_opcional(self):
+		self.assertIsNone(_validate_image_file(None))
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import copy
+import io
 import json
-import os
 import re
-from datetime import date
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from urllib.parse import urlencode
 
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
-from django.db.models import Q
-from django.http import HttpResponse
+from django.core.paginator import Paginator
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Exists, OuterRef, Q
+from django.http import FileResponse, HttpResponseRedirect
 from django.shortcuts import redirect, get_object_or_404
+from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.generic import TemplateView, View
 from fpdf import FPDF
@@ -31,6 +37,7 @@ from .models import (
 	AuditLog,
 )
 from .audit import (
+	AuditBatch,
 	log_usuario_criado,
 	log_evento_criado,
 	log_evento_atualizado,
@@ -47,6 +54,33 @@ from .emails import (
 	enviar_email_boas_vindas,
 	enviar_email_certificado,
 )
+from .tasks import run_in_background
+
+
+_IMG_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg')
+_ALLOWED_IMG_EXT = frozenset(_IMG_EXTENSIONS)
+_ALLOWED_IMG_EXT_STR = ", ".join(_IMG_EXTENSIONS)
+_ALLOWED_IMG_MIME = frozenset({
+	'image/jpeg',
+	'image/png',
+	'image/gif',
+	'image/bmp',
+	'image/webp',
+	'image/svg+xml',
+})
+_MAX_IMAGE_BYTES = 5 * 1024 * 1024  # 5MB
+# Leading bytes of the accepted raster formats (WEBP also needs "WEBP" at offset 8)
+_IMAGE_MAGIC = (
+	b'\xff\xd8\xff',  # JPEG
+	b'\x89PNG\r\n\x1a\n',  # PNG
+	b'GIF87a',
+	b'GIF89a',
+	b'BM',  # BMP
+)
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_NON_LATIN1 = re.compile(r"[^\x00-\xff]")
+_STATUS_CHOICES_MAP = dict(InscricaoStatus.choices)
+_VALID_STATUS = frozenset(_STATUS_CHOICES_MAP)
 
 
 def _validate_image_file(file) -> str | None:
@@ -57,34 +91,59 @@ def _validate_image_file(file) -> str | None:
 	if not file:
 		return None
 	
+	# Check file size first (max 5MB): cheapest test, rejects oversized uploads early
+	if file.size > _MAX_IMAGE_BYTES:
+		return "A imagem deve ter no máximo 5MB."
+	
 	# Check file extension
-	allowed_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg']
-	file_ext = os.path.splitext(file.name)[1].lower()
+	_, dot, ext = file.name.rpartition('.')
+	file_ext = f".{ext.lower()}" if dot else ""
 	
-	if file_ext not in allowed_extensions:
-		return f"Formato de arquivo inválido. Use: {', '.join(allowed_extensions)}"
+	if file_ext not in _ALLOWED_IMG_EXT:
+		return f"Formato de arquivo inválido. Use: {_ALLOWED_IMG_EXT_STR}"
 	
 	# Check MIME type
-	allowed_mime_types = [
-		'image/jpeg',
-		'image/png',
-		'image/gif',
-		'image/bmp',
-		'image/webp',
-		'image/svg+xml'
-	]
-	
-	if hasattr(file, 'content_type') and file.content_type not in allowed_mime_types:
+	if hasattr(file, 'content_type') and file.content_type not in _ALLOWED_IMG_MIME:
 		return "O arquivo enviado não é uma imagem válida."
 	
-	# Check file size (max 5MB)
-	max_size = 5 * 1024 * 1024  # 5MB in bytes
-	if file.size > max_size:
-		return "A imagem deve ter no máximo 5MB."
+	# Check the file signature: only the first bytes are read, never the whole upload
+	if not _has_image_signature(file, file_ext):
+		return "O arquivo enviado não é uma imagem válida."
 	
 	return None
 
 
+def _has_image_signature(file, file_ext: str) -> bool:
+	"""Check the leading bytes of the upload against known image formats."""
+	head = file.read(12)
+	file.seek(0)
+	if head.startswith(_IMAGE_MAGIC):
+		return True
+	if head.startswith(b'RIFF') and head[8:12] == b'WEBP':
+		return True
+	# SVG is text: a bare <svg> root, or an XML prolog only for .svg uploads
+	# (any other XML document starts the same way)
+	head = head.lstrip()
+	if head.startswith(b'<svg'):
+		return True
+	return file_ext == '.svg' and head.startswith(b'<?xml')
+
+
+def _parse_iso_date(raw: str) -> date | None:
+	"""
+	Parse a YYYY-MM-DD form value.
+	Returns None for empty or invalid input; malformed strings are rejected by
+	the regex without raising, only impossible dates (e.g. 2024-02-30) hit the
+	ValueError path.
+	"""
+	if not raw or not _ISO_DATE.fullmatch(raw):
+		return None
+	try:
+		return date.fromisoformat(raw)
+	except ValueError:
+		return None
+
+
 def _validate_password(password: str) -> str | None:
 	"""
 	Validate password meets security criteria:
@@ -112,6 +171,29 @@ def _validate_password(password: str) -> str | None:
 	return None
 
 
+def _eventos_gerenciaveis(user):
+	"""
+	Return the Evento queryset the user may edit or delete.
+	Admins see every event, organizers their own, professors the ones they are responsible for.
+	"""
+	eventos = Evento.objects.select_related("organizador", "professor_responsavel")
+	if user.perfil == PerfilChoices.ORGANIZADOR:
+		return eventos.filter(organizador=user)
+	if user.perfil == PerfilChoices.PROFESSOR:
+		return eventos.filter(professor_responsavel=user)
+	return eventos
+
+
+def _com_confirmadas(eventos):
+	"""
+	Annotate the confirmed-inscricao count so Evento.total_inscritos and
+	vagas_disponiveis don't run a COUNT query per access.
+	"""
+	return eventos.annotate(
+		confirmadas=Count("inscricoes", filter=Q(inscricoes__status=InscricaoStatus.CONFIRMADA))
+	)
+
+
 def _flatten_validation_errors(error: ValidationError) -> list[str]:
 	if hasattr(error, "error_dict"):
 		flat_errors: list[str] = []
@@ -129,20 +211,43 @@ class PostFeedbackMixin:
 	error_context_name = "form_errors"
 	warning_context_name = "form_warnings"
 	data_context_name = "form_data"
+	feedback_session_key = "post_feedback"
+	# Never round-trip secrets through the session
+	excluded_data_fields = frozenset({"csrfmiddlewaretoken", "senha", "confirmar_senha", "password"})
 
 	def render_post_response(self, *, errors: list[str] | None = None, warnings: list[str] | None = None, success: str | None = None, clear_data: bool = False, **kwargs):
+		if errors:
+			return self.redirect_with_feedback(errors=errors, warnings=warnings, clear_data=clear_data)
 		context = self.get_context_data(**kwargs)
 		context[self.data_context_name] = {} if clear_data else self.request.POST.dict()
-		if errors:
-			context[self.error_context_name] = errors
 		if warnings:
 			context[self.warning_context_name] = warnings
 		if success:
 			context[self.success_context_name] = success
 		return self.render_to_response(context)
 
+	def redirect_with_feedback(self, *, errors: list[str], warnings: list[str] | None = None, clear_data: bool = False):
+		"""
+		Post/Redirect/Get for the failure path: stash the feedback in the
+		session and let the following GET build the page context once.
+		"""
+		form_data = {} if clear_data else {
+			key: value
+			for key, value in self.request.POST.dict().items()
+			if key not in self.excluded_data_fields
+		}
+		self.request.session[self.feedback_session_key] = {
+			self.error_context_name: [str(error) for error in errors],
+			self.warning_context_name: [str(warning) for warning in warnings or []],
+			self.data_context_name: form_data,
+		}
+		return HttpResponseRedirect(self.request.get_full_path())
+
 	def get_context_data(self, **kwargs):
 		context = super().get_context_data(**kwargs)
+		feedback = self.request.session.pop(self.feedback_session_key, None)
+		if feedback:
+			context.update({key: value for key, value in feedback.items() if value})
 		context.setdefault(self.data_context_name, {})
 		return context
 
@@ -155,10 +260,6 @@ class CadastroUsuarioView(PostFeedbackMixin, TemplateView):
 		context = super().get_context_data(**kwargs)
 		context["perfis"] = PerfilChoices.choices
 		context["instituicoes"] = InstituicaoChoices.choices
-		context["usuarios_existentes"] = (
-			Usuario.objects.select_related()
-			.order_by("nome", "username")
-		)
 		return context
 
 	def post(self, request, *args, **kwargs):
@@ -279,17 +380,13 @@ class CadastroEventoView(PostFeedbackMixin, TemplateView):
 			if banner_error:
 				errors.append(banner_error)
 
-		try:
-			data_inicio = date.fromisoformat(data_inicio_raw) if data_inicio_raw else None
-		except ValueError:
+		data_inicio = _parse_iso_date(data_inicio_raw)
+		if data_inicio_raw and data_inicio is None:
 			errors.append("Data de início inválida.")
-			data_inicio = None
 
-		try:
-			data_fim = date.fromisoformat(data_fim_raw) if data_fim_raw else None
-		except ValueError:
+		data_fim = _parse_iso_date(data_fim_raw)
+		if data_fim_raw and data_fim is None:
 			errors.append("Data de término inválida.")
-			data_fim = None
 
 		try:
 			capacidade = int(capacidade_raw) if capacidade_raw else None
@@ -379,18 +476,8 @@ class EditarEventoView(PostFeedbackMixin, TemplateView):
 	def get_context_data(self, **kwargs):
 		context = super().get_context_data(**kwargs)
 		evento_id = self.kwargs.get('evento_id')
-		evento = get_object_or_404(Evento, pk=evento_id)
-		
-		# Check permission: Admin can edit any, Organizador only their own, Professor only if responsible
-		if self.request.user.perfil == PerfilChoices.ORGANIZADOR and evento.organizador != self.request.user:
-			from django.core.exceptions import PermissionDenied
-			raise PermissionDenied("Você não tem permissão para editar este evento.")
-		
-		if self.request.user.perfil == PerfilChoices.PROFESSOR and evento.professor_responsavel != self.request.user:
-			from django.core.exceptions import PermissionDenied
-			raise PermissionDenied("Você não tem permissão para editar este evento.")
-		
-		context["evento"] = evento
+		# Events outside the user's scope are reported as not found
+		context["evento"] = get_object_or_404(_eventos_gerenciaveis(self.request.user), pk=evento_id)
 		context["tipos_evento"] = TipoEventoChoices.choices
 		context["organizadores"] = (
 			Usuario.objects.filter(perfil__in=[
@@ -407,14 +494,7 @@ class EditarEventoView(PostFeedbackMixin, TemplateView):
 
 	def post(self, request, *args, **kwargs):
 		evento_id = self.kwargs.get('evento_id')
-		evento = get_object_or_404(Evento, pk=evento_id)
-		
-		# Check permission
-		if request.user.perfil == PerfilChoices.ORGANIZADOR and evento.organizador != request.user:
-			return self.render_post_response(errors=["Você não tem permissão para editar este evento."])
-		
-		if request.user.perfil == PerfilChoices.PROFESSOR and evento.professor_responsavel != request.user:
-			return self.render_post_response(errors=["Você não tem permissão para editar este evento."])
+		evento = get_object_or_404(_eventos_gerenciaveis(request.user), pk=evento_id)
 		
 		data = request.POST
 		files = request.FILES
@@ -445,17 +525,13 @@ class EditarEventoView(PostFeedbackMixin, TemplateView):
 			if banner_error:
 				errors.append(banner_error)
 
-		try:
-			data_inicio = date.fromisoformat(data_inicio_raw) if data_inicio_raw else None
-		except ValueError:
+		data_inicio = _parse_iso_date(data_inicio_raw)
+		if data_inicio_raw and data_inicio is None:
 			errors.append("Data de início inválida.")
-			data_inicio = None
 
-		try:
-			data_fim = date.fromisoformat(data_fim_raw) if data_fim_raw else None
-		except ValueError:
+		data_fim = _parse_iso_date(data_fim_raw)
+		if data_fim_raw and data_fim is None:
 			errors.append("Data de término inválida.")
-			data_fim = None
 
 		try:
 			capacidade = int(capacidade_raw) if capacidade_raw else None
@@ -501,26 +577,19 @@ class EditarEventoView(PostFeedbackMixin, TemplateView):
 
 		try:
 			# Track changed fields
-			campos_alterados = []
-			if evento.tipo != tipo:
-				campos_alterados.append('tipo')
-			if evento.titulo != titulo:
-				campos_alterados.append('titulo')
-			if evento.local != local:
-				campos_alterados.append('local')
-			if evento.data_inicio != data_inicio:
-				campos_alterados.append('data_inicio')
-			if evento.data_fim != data_fim:
-				campos_alterados.append('data_fim')
-			if evento.horario != (horario_raw or None):
-				campos_alterados.append('horario')
-			if evento.capacidade != capacidade:
-				campos_alterados.append('capacidade')
-			if evento.organizador_id != int(organizador_id):
-				campos_alterados.append('organizador')
-			if evento.professor_responsavel_id != int(professor_id):
-				campos_alterados.append('professor_responsavel')
-			
+			comparacoes = (
+				("tipo", evento.tipo, tipo),
+				("titulo", evento.titulo, titulo),
+				("local", evento.local, local),
+				("data_inicio", evento.data_inicio, data_inicio),
+				("data_fim", evento.data_fim, data_fim),
+				("horario", evento.horario, horario_raw or None),
+				("capacidade", evento.capacidade, capacidade),
+				("organizador", evento.organizador_id, organizador.pk),
+				("professor_responsavel", evento.professor_responsavel_id, professor.pk),
+			)
+			campos_alterados = [campo for campo, antigo, novo in comparacoes if antigo != novo]
+
 			# Update fields
 			evento.tipo = tipo
 			evento.titulo = titulo
@@ -531,16 +600,21 @@ class EditarEventoView(PostFeedbackMixin, TemplateView):
 			evento.capacidade = capacidade
 			evento.organizador = organizador
 			evento.professor_responsavel = professor
-			
+
+			banner_removido = None
 			if banner:
 				evento.banner = banner
 				campos_alterados.append('banner')
 			elif remover_banner and evento.banner:
-				evento.banner.delete()
+				banner_removido = (evento.banner.storage, evento.banner.name)
 				evento.banner = None
 				campos_alterados.append('banner')
 			
-			evento.save()
+			with transaction.atomic():
+				evento.save()
+				if banner_removido:
+					# Unlink the file off the request thread, only once the update commits
+					run_in_background(banner_removido[0].delete, banner_removido[1])
 			
 			# Log event update
 			log_evento_atualizado(request, evento, campos_alterados)
@@ -566,24 +640,12 @@ class DeletarEventoView(TemplateView):
 	def get_context_data(self, **kwargs):
 		context = super().get_context_data(**kwargs)
 		evento_id = self.kwargs.get('evento_id')
-		evento = get_object_or_404(Evento, pk=evento_id)
-		
-		# Check permission: Admin can delete any, Organizador only their own
-		if self.request.user.perfil == PerfilChoices.ORGANIZADOR and evento.organizador != self.request.user:
-			from django.core.exceptions import PermissionDenied
-			raise PermissionDenied("Você não tem permissão para deletar este evento.")
-		
-		context["evento"] = evento
+		context["evento"] = get_object_or_404(_eventos_gerenciaveis(self.request.user), pk=evento_id)
 		return context
 
 	def post(self, request, *args, **kwargs):
 		evento_id = self.kwargs.get('evento_id')
-		evento = get_object_or_404(Evento, pk=evento_id)
-		
-		# Check permission
-		if request.user.perfil == PerfilChoices.ORGANIZADOR and evento.organizador != request.user:
-			messages.error(request, "Você não tem permissão para deletar este evento.")
-			return redirect('dashboard')
+		evento = get_object_or_404(_eventos_gerenciaveis(request.user), pk=evento_id)
 		
 		# Capture event info before deletion
 		evento_info = {
@@ -617,14 +679,14 @@ class InscricaoUsuarioView(PostFeedbackMixin, TemplateView):
 		if self.request.user.perfil == PerfilChoices.ORGANIZADOR:
 			# ORGANIZADOR only sees their own events
 			context["eventos"] = (
-				Evento.objects.filter(organizador=self.request.user)
+				_com_confirmadas(Evento.objects.filter(organizador=self.request.user))
 				.select_related("organizador")
 				.order_by("data_inicio", "tipo")
 			)
 		else:
 			# ADMIN, ALUNO, PROFESSOR see all events
 			context["eventos"] = (
-				Evento.objects.select_related("organizador")
+				_com_confirmadas(Evento.objects.select_related("organizador"))
 				.order_by("data_inicio", "tipo")
 			)
 		
@@ -635,21 +697,16 @@ class InscricaoUsuarioView(PostFeedbackMixin, TemplateView):
 			
 			# Create mappings:
 			# 1. event_id -> list of participant_ids
-			# 2. "event_id_participant_id" -> status
-			evento_participantes = {}
-			inscricao_status_map = {}
+			# 2. event_id -> {participant_id: status}
+			evento_participantes = defaultdict(list)
+			inscricao_status_map = defaultdict(dict)
 			
 			for inscricao in inscricoes:
 				evento_id = inscricao.evento_id
 				participante_id = inscricao.participante_id
 				
-				if evento_id not in evento_participantes:
-					evento_participantes[evento_id] = []
 				evento_participantes[evento_id].append(participante_id)
-				
-				# Store status with composite key
-				key = f"{evento_id}_{participante_id}"
-				inscricao_status_map[key] = inscricao.get_status_display()
+				inscricao_status_map[evento_id][participante_id] = inscricao.get_status_display()
 			
 			context["evento_participantes_json"] = json.dumps(evento_participantes)
 			context["inscricao_status_map_json"] = json.dumps(inscricao_status_map)
@@ -692,7 +749,7 @@ class InscricaoUsuarioView(PostFeedbackMixin, TemplateView):
 			# Prevent organizador from selecting themselves
 			elif str(participante_id) == str(request.user.pk):
 				errors.append("Organizadores não podem se inscrever em eventos.")
-			if status not in dict(InscricaoStatus.choices):
+			if status not in _VALID_STATUS:
 				errors.append("Status de inscrição inválido.")
 		else:
 			# ADMIN can register others
@@ -702,7 +759,7 @@ class InscricaoUsuarioView(PostFeedbackMixin, TemplateView):
 			
 			if not participante_id:
 				errors.append("Selecione um participante.")
-			if status not in dict(InscricaoStatus.choices):
+			if status not in _VALID_STATUS:
 				errors.append("Status de inscrição inválido.")
 
 		if not evento_id:
@@ -725,13 +782,13 @@ class InscricaoUsuarioView(PostFeedbackMixin, TemplateView):
 		# Validate ORGANIZADOR can only manage their own events
 		if request.user.perfil == PerfilChoices.ORGANIZADOR:
 			try:
-				evento = Evento.objects.get(pk=evento_id, organizador=request.user)
+				evento = _com_confirmadas(Evento.objects).get(pk=evento_id, organizador=request.user)
 			except Evento.DoesNotExist:
 				return self.render_post_response(errors=["Você não tem permissão para gerenciar inscrições deste evento."])
 		else:
 			# ADMIN can manage any event, ALUNO/PROFESSOR already validated
 			try:
-				evento = Evento.objects.get(pk=evento_id)
+				evento = _com_confirmadas(Evento.objects).get(pk=evento_id)
 			except Evento.DoesNotExist:
 				return self.render_post_response(errors=["Evento não encontrado."])
 
@@ -747,7 +804,7 @@ class InscricaoUsuarioView(PostFeedbackMixin, TemplateView):
 				# ADMIN/ORGANIZADOR can update status
 				# Warning if trying to change status when presence is confirmed
 				if existing_inscricao.presenca_confirmada and existing_inscricao.status != status:
-					messages.warning(request, f"A presença deste participante já foi confirmada. O status foi alterado de {existing_inscricao.get_status_display()} para {dict(InscricaoStatus.choices)[status]}. A presença foi removida pois o novo status não é 'Confirmada'.")
+					messages.warning(request, f"A presença deste participante já foi confirmada. O status foi alterado de {existing_inscricao.get_status_display()} para {_STATUS_CHOICES_MAP[status]}. A presença foi removida pois o novo status não é 'Confirmada'.")
 					# Reset presence if status is not CONFIRMADA
 					if status != InscricaoStatus.CONFIRMADA:
 						existing_inscricao.presenca_confirmada = False
@@ -806,6 +863,13 @@ class EmissaoCertificadoView(PostFeedbackMixin, TemplateView):
 			context["inscricoes_elegiveis"] = (
 				inscricoes_query
 				.select_related("evento", "participante")
+				.only(
+					"data_inscricao",
+					"evento__titulo",
+					"evento__tipo",
+					"evento__data_inicio",
+					"participante__nome",
+				)
 				.order_by("-data_inscricao")
 			)
 			context["emissores"] = (
@@ -859,12 +923,9 @@ class EmissaoCertificadoView(PostFeedbackMixin, TemplateView):
 			except (TypeError, ValueError):
 				errors.append("Carga horária inválida.")
 
-		validade = None
-		if validade_raw:
-			try:
-				validade = date.fromisoformat(validade_raw)
-			except ValueError:
-				errors.append("Data de validade inválida.")
+		validade = _parse_iso_date(validade_raw)
+		if validade_raw and validade is None:
+			errors.append("Data de validade inválida.")
 
 		if errors:
 			return self.render_post_response(errors=errors)
@@ -895,26 +956,23 @@ class EmissaoCertificadoView(PostFeedbackMixin, TemplateView):
 			return self.render_post_response(errors=["Emissor selecionado não é válido."])
 
 		try:
-			certificado, created = Certificado.objects.update_or_create(
-				inscricao=inscricao,
-				defaults={
-					"emitido_por": emissor,
-					"carga_horaria": carga_horaria,
-					"validade": validade,
-					"observacoes": observacoes,
-				},
-			)
-			
-			# Log certificate generation
-			log_certificado_gerado(request, certificado)
+			# Signal and explicit audit entries go out in one insert
+			with AuditBatch():
+				certificado, created = Certificado.objects.update_or_create(
+					inscricao=inscricao,
+					defaults={
+						"emitido_por": emissor,
+						"carga_horaria": carga_horaria,
+						"validade": validade,
+						"observacoes": observacoes,
+					},
+				)
+				
+				# Log certificate generation
+				log_certificado_gerado(request, certificado)
 			
-			# Send certificate email
-			try:
-				enviar_email_certificado(certificado)
-			except Exception as e:
-				# Se falhar o envio do email, não deve impedir a criação do certificado,
-				# mas deve avisar o usuário.
-				messages.warning(request, f"Certificado gerado, mas houve erro ao enviar o e-mail: {e}")
+			# Send certificate email off the request thread; failures are logged by the worker
+			run_in_background(enviar_email_certificado, certificado)
 			
 		except ValidationError as exc:
 			return self.render_post_response(errors=_flatten_validation_errors(exc))
@@ -925,66 +983,88 @@ class EmissaoCertificadoView(PostFeedbackMixin, TemplateView):
 		return self.render_post_response(success=success, clear_data=True)
 
 
-@method_decorator(login_required, name='dispatch')
+def _latin1(text: str) -> str:
+	"""
+	FPDF core fonts only cover Latin-1: keep accented Portuguese characters
+	and replace anything outside that range with '?'.
+	"""
+	return _NON_LATIN1.sub("?", text)
+
+
+@lru_cache(maxsize=1)
+def _certificado_base() -> FPDF:
+	"""
+	Build the static part of the certificate (page, borders and header) once.
+	Callers must deepcopy the result before drawing on it.
+	"""
+	pdf = FPDF(orientation='L', unit='mm', format='A4')
+	pdf.add_page()
+	
+	# Register every Helvetica style the certificate uses so copies inherit them
+	for style in ("", "I"):
+		pdf.set_font("Helvetica", style)
+	
+	# Border
+	pdf.set_line_width(1)
+	pdf.rect(10, 10, 277, 190)
+	pdf.set_line_width(0.5)
+	pdf.rect(12, 12, 273, 186)
+	
+	# Header
+	pdf.set_font("Helvetica", "B", 30)
+	pdf.set_text_color(50, 50, 50)
+	pdf.cell(0, 40, "CERTIFICADO DE PARTICIPACAO", align="C", new_x="LMARGIN", new_y="NEXT")
+	
+	pdf.ln(10)
+	return pdf
+
+
+def _pode_ver_certificado(request, pk, **kwargs) -> bool:
+	"""
+	Owner check for certificate downloads: participants see their own
+	certificates, organizers those of their events, admins all of them.
+	Unknown pks pass so the view answers with a 404.
+	"""
+	user = request.user
+	if user.perfil == PerfilChoices.ADMIN:
+		return True
+	outros = Certificado.objects.filter(pk=pk)
+	if user.perfil == PerfilChoices.ORGANIZADOR:
+		outros = outros.exclude(inscricao__evento__organizador=user)
+	else:
+		outros = outros.exclude(inscricao__participante=user)
+	return not outros.exists()
+
+
+@method_decorator(perfil_required(*PerfilChoices.values, owner_check=_pode_ver_certificado), name='dispatch')
 class GerarCertificadoPDFView(View):
 	def get(self, request, pk):
-		certificado = get_object_or_404(Certificado, pk=pk)
-		
-		# Check permissions
-		if request.user.perfil in [PerfilChoices.ALUNO, PerfilChoices.PROFESSOR]:
-			if certificado.inscricao.participante != request.user:
-				messages.error(request, "Você não tem permissão para visualizar este certificado.")
-				return redirect('dashboard')
-		elif request.user.perfil == PerfilChoices.ORGANIZADOR:
-			if certificado.inscricao.evento.organizador != request.user:
-				messages.error(request, "Você não tem permissão para visualizar este certificado.")
-				return redirect('dashboard')
-		# Admin can view all
-		
-		# Generate PDF
-		pdf = FPDF(orientation='L', unit='mm', format='A4')
-		pdf.add_page()
-		
-		# Border
-		pdf.set_line_width(1)
-		pdf.rect(10, 10, 277, 190)
-		pdf.set_line_width(0.5)
-		pdf.rect(12, 12, 273, 186)
-		
-		# Header
-		pdf.set_font("Helvetica", "B", 30)
-		pdf.set_text_color(50, 50, 50)
-		pdf.cell(0, 40, "CERTIFICADO DE PARTICIPACAO", align="C", new_x="LMARGIN", new_y="NEXT")
+		# Permissions are checked by perfil_required before this runs
+		certificado = get_object_or_404(
+			Certificado.objects.select_related('inscricao__participante', 'inscricao__evento'),
+			pk=pk,
+		)
 		
-		pdf.ln(10)
+		# Generate PDF on a copy of the cached static layout
+		pdf = copy.deepcopy(_certificado_base())
 		
 		# Body
 		pdf.set_font("Helvetica", "", 16)
 		pdf.set_text_color(0, 0, 0)
 		
-		# Remove accents for FPDF standard fonts or use a unicode font
-		# For simplicity, I'll strip accents or use basic ASCII for now to avoid encoding issues with standard fonts
-		# In a real app, we would load a TTF font.
+		# Core fonts (Helvetica) need no font file and cover Latin-1, which is
+		# enough for Portuguese; _latin1() replaces anything outside that range.
 		
 		participante_nome = certificado.inscricao.participante.nome
 		evento_titulo = certificado.inscricao.evento.titulo or certificado.inscricao.evento.get_tipo_display()
 		evento_local = certificado.inscricao.evento.local
 		
-		# Simple accent replacement for standard fonts (Latin-1)
-		def clean_text(text):
-			return text.encode('latin-1', 'replace').decode('latin-1')
-
-		try:
-			texto = (
-				f"Certificamos que {participante_nome} participou do evento "
-				f"\"{evento_titulo}\", "
-				f"realizado em {evento_local}, "
-				f"com carga horaria de {certificado.carga_horaria} horas."
-			)
-			# FPDF default fonts support Latin-1
-			texto = texto.encode('latin-1', 'replace').decode('latin-1')
-		except:
-			texto = "Erro na codificacao do texto."
+		texto = _latin1(
+			f"Certificamos que {participante_nome} participou do evento "
+			f"\"{evento_titulo}\", "
+			f"realizado em {evento_local}, "
+			f"com carga horaria de {certificado.carga_horaria} horas."
+		)
 
 		pdf.multi_cell(0, 10, texto, align="C", new_x="LMARGIN", new_y="NEXT")
 		
@@ -1021,8 +1101,12 @@ class GerarCertificadoPDFView(View):
 		pdf.cell(0, 10, f"Certificado gerado eletronicamente em {date.today().strftime('%d/%m/%Y')}", align="C")
 		
 		# Output
-		response = HttpResponse(bytes(pdf.output()), content_type='application/pdf')
-		response['Content-Disposition'] = f'attachment; filename="certificado_{certificado.id}.pdf"'
+		response = FileResponse(
+			io.BytesIO(pdf.output()),
+			as_attachment=True,
+			filename=f"certificado_{certificado.id}.pdf",
+			content_type='application/pdf',
+		)
 		
 		# Log access
 		log_certificado_consultado(request, certificado)
@@ -1124,19 +1208,27 @@ class PresencaView(PostFeedbackMixin, TemplateView):
 			return self.render_post_response(errors=["Evento não encontrado."])
 		
 		# Get all confirmed inscriptions for this event
+		# Only the columns needed for the update and its audit entries
 		inscricoes = Inscricao.objects.filter(
 			evento=evento,
 			status=InscricaoStatus.CONFIRMADA
-		)
+		).select_related("participante").only("status", "presenca_confirmada", "participante__nome")
 		
-		# Update presence for each inscription
-		updated_count = 0
+		# Collect the changed inscriptions and write them in one UPDATE batch
+		alteradas = []
 		for inscricao in inscricoes:
 			presenca_marcada = f"presenca_{inscricao.pk}" in request.POST
 			if inscricao.presenca_confirmada != presenca_marcada:
 				inscricao.presenca_confirmada = presenca_marcada
-				inscricao.save()
-				updated_count += 1
+				inscricao.evento = evento
+				alteradas.append(inscricao)
+		
+		with transaction.atomic(), AuditBatch():
+			Inscricao.objects.bulk_update(alteradas, ["presenca_confirmada"], batch_size=500)
+			# bulk_update() bypasses post_save, so log each change explicitly
+			for inscricao in alteradas:
+				log_inscricao_atualizada(request, inscricao)
+		updated_count = len(alteradas)
 		
 		success = f"Presenças atualizadas com sucesso! ({updated_count} alterações)"
 		return self.render_post_response(success=success)
@@ -1156,13 +1248,17 @@ class DashboardView(TemplateView):
 class DetalhesEventoView(PostFeedbackMixin, TemplateView):
 	template_name = "api/detalhes_evento.html"
 	
+	def _get_evento(self):
+		"""Single lookup shared by GET and POST, with the relations both of them read."""
+		return get_object_or_404(
+			_com_confirmadas(Evento.objects.select_related('organizador', 'professor_responsavel')),
+			pk=self.kwargs.get('evento_id')
+		)
+	
 	def get_context_data(self, **kwargs):
 		context = super().get_context_data(**kwargs)
 		evento_id = self.kwargs.get('evento_id')
-		context['evento'] = get_object_or_404(
-			Evento.objects.select_related('organizador', 'professor_responsavel'), 
-			pk=evento_id
-		)
+		context['evento'] = self._get_evento()
 		
 		# Check if current user has an inscricao for this event
 		if self.request.user.perfil in [PerfilChoices.ALUNO, PerfilChoices.PROFESSOR]:
@@ -1188,11 +1284,10 @@ class DetalhesEventoView(PostFeedbackMixin, TemplateView):
 					perfil__in=[PerfilChoices.ALUNO, PerfilChoices.PROFESSOR]
 				).order_by('nome')
 				
-				# Get list of already inscribed participant IDs
-				inscribed_ids = set(inscricoes.values_list('participante_id', flat=True))
-				
-				# Filter to get only non-inscribed participants
-				available_participantes = all_participantes.exclude(pk__in=inscribed_ids)
+				# Filter to get only non-inscribed participants (anti-join in the database)
+				available_participantes = all_participantes.filter(
+					~Exists(Inscricao.objects.filter(evento_id=evento_id, participante=OuterRef('pk')))
+				)
 				
 				context['participantes'] = all_participantes
 				context['available_participantes'] = available_participantes
@@ -1203,7 +1298,7 @@ class DetalhesEventoView(PostFeedbackMixin, TemplateView):
 	def post(self, request, *args, **kwargs):
 		"""Handle inscricao management for ADMIN/Organizador and cancellation for Aluno/Professor"""
 		evento_id = self.kwargs.get('evento_id')
-		evento = get_object_or_404(Evento, pk=evento_id)
+		evento = self._get_evento()
 		
 		# Handle new inscription from Aluno/Professor (self-registration)
 		if request.user.perfil in [PerfilChoices.ALUNO, PerfilChoices.PROFESSOR]:
@@ -1271,7 +1366,7 @@ class DetalhesEventoView(PostFeedbackMixin, TemplateView):
 		if not participante_id:
 			errors.append("Selecione um participante.")
 		
-		if status not in dict(InscricaoStatus.choices):
+		if status not in _VALID_STATUS:
 			errors.append("Status de inscrição inválido.")
 		
 		if errors:
@@ -1287,51 +1382,32 @@ class DetalhesEventoView(PostFeedbackMixin, TemplateView):
 		except Usuario.DoesNotExist:
 			return self.render_post_response(errors=["Participante não encontrado."])
 		
-		# Check if already registered
-		existing_inscricao = Inscricao.objects.filter(
-			evento_id=evento_id,
-			participante_id=participante_id
-		).first()
-		
-		if existing_inscricao:
-			# Update existing inscricao
-			status_anterior = existing_inscricao.status
-			
-			# Warning if trying to change status when presence is confirmed
-			if existing_inscricao.presenca_confirmada and existing_inscricao.status != status:
-				if status != InscricaoStatus.CONFIRMADA:
-					messages.warning(request, f"A presença deste participante já foi confirmada. O status foi alterado de {existing_inscricao.get_status_display()} para {dict(InscricaoStatus.choices)[status]}. A presença foi removida pois o novo status não é 'Confirmada'.")
-					existing_inscricao.presenca_confirmada = False
-
-			existing_inscricao.status = status
-			existing_inscricao.save()
-			
-			# Log update
-			log_inscricao_atualizada(request, existing_inscricao, status_anterior)
-			
-			return self.render_post_response(success="Inscrição atualizada com sucesso.", clear_data=True)
-		
-		# Create new inscricao
-		if status == InscricaoStatus.CONFIRMADA and evento.vagas_disponiveis <= 0:
-			return self.render_post_response(errors=["O evento não possui vagas disponíveis."])
+		# Create or update atomically; presence only survives a CONFIRMADA status
+		defaults = {"status": status}
+		if status != InscricaoStatus.CONFIRMADA:
+			defaults["presenca_confirmada"] = False
 		
 		try:
-			inscricao = Inscricao.objects.create(
+			inscricao, created = Inscricao.objects.update_or_create(
 				evento_id=evento_id,
 				participante_id=participante_id,
-				status=status,
+				defaults=defaults,
 			)
-			
-			# Log creation
-			log_inscricao_criada(request, inscricao)
-			
 		except ValidationError as exc:
-			errors.extend(_flatten_validation_errors(exc))
+			return self.render_post_response(errors=_flatten_validation_errors(exc))
 		except IntegrityError:
-			errors.append("Não foi possível registrar a inscrição.")
+			return self.render_post_response(errors=["Não foi possível registrar a inscrição."])
 		
-		if errors:
-			return self.render_post_response(errors=errors)
+		if created:
+			log_inscricao_criada(request, inscricao)
+		else:
+			# Previous values are captured by the pre_save signal
+			status_anterior = inscricao._old_status
+			if inscricao._old_presenca and not inscricao.presenca_confirmada:
+				messages.warning(request, f"A presença deste participante já foi confirmada. O status foi alterado de {_STATUS_CHOICES_MAP[status_anterior]} para {_STATUS_CHOICES_MAP[status]}. A presença foi removida pois o novo status não é 'Confirmada'.")
+			
+			log_inscricao_atualizada(request, inscricao, status_anterior)
+			return self.render_post_response(success="Inscrição atualizada com sucesso.", clear_data=True)
 		
 		success = "Inscrição criada com sucesso."
 		return self.render_post_response(success=success, clear_data=True)
@@ -1340,6 +1416,7 @@ class DetalhesEventoView(PostFeedbackMixin, TemplateView):
 class SignupView(PostFeedbackMixin, TemplateView):
 	"""Public signup view for ALUNO, PROFESSOR, and ORGANIZADOR"""
 	template_name = "api/signup.html"
+	campos_formulario = ("nome", "username", "email", "telefone", "perfil", "instituicao", "senha", "confirmar_senha")
 
 	def get_context_data(self, **kwargs):
 		context = super().get_context_data(**kwargs)
@@ -1356,14 +1433,9 @@ class SignupView(PostFeedbackMixin, TemplateView):
 		data = request.POST
 		errors: list[str] = []
 
-		nome = data.get("nome", "").strip()
-		username = data.get("username", "").strip()
-		email = data.get("email", "").strip()
-		telefone = data.get("telefone", "").strip()
-		perfil = data.get("perfil", "").strip()
-		instituicao_raw = data.get("instituicao", "").strip()
-		senha = data.get("senha", "").strip()
-		confirmar_senha = data.get("confirmar_senha", "").strip()
+		nome, username, email, telefone, perfil, instituicao_raw, senha, confirmar_senha = (
+			data.get(campo, "").strip() for campo in self.campos_formulario
+		)
 
 		if not nome:
 			errors.append("Informe o nome completo.")
@@ -1392,6 +1464,10 @@ class SignupView(PostFeedbackMixin, TemplateView):
 		if errors:
 			return self.render_post_response(errors=errors)
 
+		# Cheap duplicate check before create_user() spends a full password hash
+		if Usuario.objects.filter(Q(username=username) | Q(email=email)).exists():
+			return self.render_post_response(errors=["Usuário ou e-mail já cadastrado."])
+
 		try:
 			usuario = Usuario.objects.create_user(
 				username=username,
@@ -1406,8 +1482,8 @@ class SignupView(PostFeedbackMixin, TemplateView):
 			# Auto-login the user after successful registration
 			login(request, usuario)
 			
-			# Send welcome email
-			enviar_email_boas_vindas(usuario)
+			# Send welcome email off the request thread
+			run_in_background(enviar_email_boas_vindas, usuario)
 			
 			messages.success(request, f"Conta criada com sucesso! Bem-vindo, {usuario.nome}!")
 			return redirect('dashboard')
@@ -1511,26 +1587,39 @@ class PerfilUsuarioView(PostFeedbackMixin, TemplateView):
 @method_decorator(organizador_or_admin_required, name='dispatch')
 class AuditLogView(TemplateView):
     template_name = 'api/audit_logs.html'
+    paginate_by = 50
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        logs = AuditLog.objects.all().select_related('usuario', 'usuario_afetado', 'evento')
+        # The template only renders the acting user
+        logs = AuditLog.objects.all().select_related('usuario')
         
         # Filters
         data_filtro = self.request.GET.get('data')
         usuario_filtro = self.request.GET.get('usuario')
         
-        if data_filtro:
-            logs = logs.filter(data_hora__date=data_filtro)
+        dia = _parse_iso_date(data_filtro)
+        if dia:
+            # Half-open range on the raw column so the data_hora index can be used
+            inicio = timezone.make_aware(datetime.combine(dia, time.min))
+            logs = logs.filter(data_hora__gte=inicio, data_hora__lt=inicio + timedelta(days=1))
             
         if usuario_filtro:
-            logs = logs.filter(
-                Q(usuario__username__icontains=usuario_filtro) | 
-                Q(usuario__nome__icontains=usuario_filtro)
-            )
+            # Match against the (small) user table first, then let the
+            # AuditLog.usuario index pick the rows instead of LIKE-ing every log
+            usuarios = Usuario.objects.filter(
+                Q(username__icontains=usuario_filtro) |
+                Q(nome__icontains=usuario_filtro)
+            ).values('pk')
+            logs = logs.filter(usuario__in=usuarios)
             
-        context['logs'] = logs
+        page_obj = Paginator(logs, self.paginate_by).get_page(self.request.GET.get('page'))
+        filtros = {chave: valor for chave, valor in (('data', data_filtro), ('usuario', usuario_filtro)) if valor}
+        
+        context['logs'] = page_obj
+        context['page_obj'] = page_obj
+        context['filtros_query'] = urlencode(filtros)
         context['data_filtro'] = data_filtro
         context['usuario_filtro'] = usuario_filtro
         return context
@@ -1,19 +1,31 @@
 #!/usr/bin/env python
 """
 Script para popular o banco de dados com dados de exemplo para o AEGS.
-Execute com: python database/load_sample_data.py
+Execute com: python database/load_sample_data.py [--fast]
+
+Com --fast, restaura o snapshot salvo pela última carga completa (se ainda
+for válido) em vez de recriar os dados.
 """
 import os
+import shutil
+import subprocess
 import sys
 import django
-from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
 
 # Configurar Django
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'gestor_eventos.settings')
 django.setup()
 
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+
 from api.models import (
+    AuditLog,
     Usuario,
     Evento,
     Inscricao,
@@ -23,15 +35,201 @@ from api.models import (
     TipoEventoChoices,
     InscricaoStatus,
 )
+from api.signals import desativar_sinais
+
+# (username, senha, campos); as demais funções acessam cada usuário pelo
+# username com '.' trocado por '_' (ex: usuarios.carlos_org)
+USER_SPECS = [
+    ('admin', 'Admin@123', {
+        'email': 'admin@sgea.local',
+        'nome': 'Administrador do Sistema',
+        'telefone': '(61) 91111-1111',
+        'perfil': PerfilChoices.ADMIN,
+        'is_staff': True,
+        'is_superuser': True,
+    }),
+    # Organizadores
+    ('carlos.org', 'Organizador@123', {
+        'email': 'carlos@sgea.local',
+        'nome': 'Carlos Organizador',
+        'telefone': '(61) 92222-2222',
+        'perfil': PerfilChoices.ORGANIZADOR,
+    }),
+    ('julia.org', 'Organizador@123', {
+        'email': 'julia@sgea.local',
+        'nome': 'Julia Organizadora',
+        'telefone': '(61) 93333-3333',
+        'perfil': PerfilChoices.ORGANIZADOR,
+    }),
+    # Alunos
+    ('bruno.aluno', 'Aluno@123', {
+        'email': 'bruno@sgea.local',
+        'nome': 'Bruno Aluno Silva',
+        'telefone': '(61) 94444-4444',
+        'perfil': PerfilChoices.ALUNO,
+        'instituicao': InstituicaoChoices.UNB,
+    }),
+    ('ana.aluna', 'Aluno@123', {
+        'email': 'ana@sgea.local',
+        'nome': 'Ana Paula Aluna',
+        'telefone': '(61) 95555-5555',
+        'perfil': PerfilChoices.ALUNO,
+        'instituicao': InstituicaoChoices.IFB,
+    }),
+    ('pedro.aluno', 'Aluno@123', {
+        'email': 'pedro@sgea.local',
+        'nome': 'Pedro Henrique Costa',
+        'telefone': '(61) 96666-6666',
+        'perfil': PerfilChoices.ALUNO,
+        'instituicao': InstituicaoChoices.CEUB,
+    }),
+    # Professores
+    ('maria.prof', 'Professor@123', {
+        'email': 'maria@sgea.local',
+        'nome': 'Maria Professora Santos',
+        'telefone': '(61) 97777-7777',
+        'perfil': PerfilChoices.PROFESSOR,
+        'instituicao': InstituicaoChoices.UNB,
+    }),
+    ('joao.prof', 'Professor@123', {
+        'email': 'joao@sgea.local',
+        'nome': 'João Professor Oliveira',
+        'telefone': '(61) 98888-8888',
+        'perfil': PerfilChoices.PROFESSOR,
+        'instituicao': InstituicaoChoices.UCB,
+    }),
+    # Usuários de Teste Solicitados
+    ('organizador', 'Organizador@123', {
+        'email': 'organizador@sgea.com',
+        'nome': 'Organizador de Teste',
+        'telefone': '(61) 99999-9999',
+        'perfil': PerfilChoices.ORGANIZADOR,
+    }),
+    ('aluno', 'Aluno@123', {
+        'email': 'aluno@sgea.com',
+        'nome': 'Aluno de Teste',
+        'telefone': '(61) 98888-8888',
+        'perfil': PerfilChoices.ALUNO,
+        'instituicao': InstituicaoChoices.UNB,
+    }),
+    ('professor', 'Professor@123', {
+        'email': 'professor@sgea.com',
+        'nome': 'Professor de Teste',
+        'telefone': '(61) 97777-7777',
+        'perfil': PerfilChoices.PROFESSOR,
+        'instituicao': InstituicaoChoices.UNB,
+    }),
+]
+
+# (tipo, dias até o início, dias até o fim, local, capacidade, organizador)
+EVENT_SPECS = [
+    # Evento passado
+    (TipoEventoChoices.PALESTRA, -10, -10, 'Auditório Central', 200, 'carlos_org'),
+    # Evento em andamento
+    (TipoEventoChoices.WORKSHOP, -1, 1, 'Sala 301', 30, 'julia_org'),
+    # Eventos futuros
+    (TipoEventoChoices.MINICURSO, 7, 9, 'Laboratório 202', 25, 'carlos_org'),
+    (TipoEventoChoices.SEMINARIO, 15, 17, 'Auditório Norte', 150, 'julia_org'),
+    (TipoEventoChoices.PALESTRA, 30, 30, 'Sala de Conferências', 100, 'carlos_org'),
+    # Evento com capacidade baixa para testar limite
+    (TipoEventoChoices.WORKSHOP, 20, 21, 'Sala Pequena', 5, 'julia_org'),
+]
+
+
+# Linhas por INSERT nas cargas em lote
+LOTE_INSERCAO = 500
+
+# Snapshot do banco após uma carga completa (usado por --fast)
+SNAPSHOT_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.seed_snapshot')
+
+
+def _snapshot_path():
+    """Caminho do snapshot para o banco atual, ou None se não suportado."""
+    if connection.vendor == 'sqlite':
+        return SNAPSHOT_BASE + '.sqlite3'
+    if connection.vendor == 'postgresql':
+        return SNAPSHOT_BASE + '.dump'
+    return None
+
+
+def _pg_cli():
+    """Argumentos de conexão e ambiente para pg_dump/pg_restore."""
+    settings = connection.settings_dict
+    args = []
+    for flag, chave in (('-h', 'HOST'), ('-p', 'PORT'), ('-U', 'USER')):
+        if settings.get(chave):
+            args += [flag, str(settings[chave])]
+    env = dict(os.environ)
+    if settings.get('PASSWORD'):
+        env['PGPASSWORD'] = settings['PASSWORD']
+    return args, env
+
+
+def salvar_snapshot():
+    """Salva o banco recém-populado para restaurações rápidas."""
+    caminho = _snapshot_path()
+    if caminho is None:
+        return
+    if connection.vendor == 'sqlite':
+        # Fechar antes de copiar: o arquivo fica consistente em disco
+        connection.close()
+        shutil.copyfile(connection.settings_dict['NAME'], caminho)
+    else:
+        args, env = _pg_cli()
+        subprocess.run(
+            ['pg_dump', '-Fc', '-f', caminho, *args, connection.settings_dict['NAME']],
+            env=env, check=True,
+        )
+    print(f"Snapshot salvo em {caminho}\n")
+
+
+def restaurar_snapshot():
+    """
+    Restaura o snapshot se ele for válido; retorna False caso contrário.
+
+    Válido significa mais novo que este script e gerado hoje: as datas dos
+    eventos são relativas ao dia da carga.
+    """
+    caminho = _snapshot_path()
+    if caminho is None or not os.path.exists(caminho):
+        return False
+    modificado = os.path.getmtime(caminho)
+    if modificado < os.path.getmtime(__file__) or datetime.fromtimestamp(modificado).date() != date.today():
+        return False
+    
+    connection.close()
+    if connection.vendor == 'sqlite':
+        shutil.copyfile(caminho, connection.settings_dict['NAME'])
+    else:
+        args, env = _pg_cli()
+        subprocess.run(
+            ['pg_restore', '--clean', '--if-exists', '-d', connection.settings_dict['NAME'], *args, caminho],
+            env=env, check=True,
+        )
+    print(f"Snapshot restaurado de {caminho}\n")
+    return True
 
 
 def limpar_dados():
     """Remove todos os dados existentes."""
     print("Limpando dados existentes...")
-    Certificado.objects.all().delete()
-    Inscricao.objects.all().delete()
-    Evento.objects.all().delete()
-    Usuario.objects.all().delete()
+    modelos = [Certificado, Inscricao, Evento, Usuario]
+    if connection.vendor == 'postgresql' and os.environ.get('ALLOW_TRUNCATE'):
+        # Um único TRUNCATE em vez de DELETEs encadeados. Só com ALLOW_TRUNCATE:
+        # o CASCADE também esvazia as tabelas que apontam para estas (auditoria, tokens).
+        tabelas = ", ".join(connection.ops.quote_name(m._meta.db_table) for m in modelos)
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {tabelas} RESTART IDENTITY CASCADE")
+    else:
+        with transaction.atomic():
+            # Mesmo efeito do SET_NULL em cascata, num único UPDATE
+            AuditLog.objects.update(evento=None, inscricao=None, certificado=None)
+            # DELETE FROM simples por tabela: sem sinais e sem objetos em memória
+            for modelo in (Certificado, Inscricao, Evento):
+                queryset = modelo.objects.all()
+                queryset._raw_delete(queryset.db)
+            # Usuários ainda passam pelo coletor (tokens, log do admin, grupos)
+            Usuario.objects.all().delete()
     print("Dados limpos.\n")
 
 
@@ -39,137 +237,19 @@ def criar_usuarios():
     """Cria usuários de exemplo com diferentes perfis."""
     print("Criando usuarios...")
     
-    usuarios = []
-    
-    # Admin
-    admin = Usuario.objects.create_user(
-        username='admin',
-        password='Admin@123',
-        email='admin@sgea.local',
-        nome='Administrador do Sistema',
-        telefone='(61) 91111-1111',
-        perfil=PerfilChoices.ADMIN,
-        is_staff=True,
-        is_superuser=True,
-    )
-    usuarios.append(admin)
-    
-    # Organizadores
-    org1 = Usuario.objects.create_user(
-        username='carlos.org',
-        password='Organizador@123',
-        email='carlos@sgea.local',
-        nome='Carlos Organizador',
-        telefone='(61) 92222-2222',
-        perfil=PerfilChoices.ORGANIZADOR,
-    )
-    usuarios.append(org1)
-    
-    org2 = Usuario.objects.create_user(
-        username='julia.org',
-        password='Organizador@123',
-        email='julia@sgea.local',
-        nome='Julia Organizadora',
-        telefone='(61) 93333-3333',
-        perfil=PerfilChoices.ORGANIZADOR,
-    )
-    usuarios.append(org2)
-    
-    # Alunos
-    aluno1 = Usuario.objects.create_user(
-        username='bruno.aluno',
-        password='Aluno@123',
-        email='bruno@sgea.local',
-        nome='Bruno Aluno Silva',
-        telefone='(61) 94444-4444',
-        perfil=PerfilChoices.ALUNO,
-        instituicao=InstituicaoChoices.UNB,
-    )
-    usuarios.append(aluno1)
-    
-    aluno2 = Usuario.objects.create_user(
-        username='ana.aluna',
-        password='Aluno@123',
-        email='ana@sgea.local',
-        nome='Ana Paula Aluna',
-        telefone='(61) 95555-5555',
-        perfil=PerfilChoices.ALUNO,
-        instituicao=InstituicaoChoices.IFB,
-    )
-    usuarios.append(aluno2)
-    
-    aluno3 = Usuario.objects.create_user(
-        username='pedro.aluno',
-        password='Aluno@123',
-        email='pedro@sgea.local',
-        nome='Pedro Henrique Costa',
-        telefone='(61) 96666-6666',
-        perfil=PerfilChoices.ALUNO,
-        instituicao=InstituicaoChoices.CEUB,
-    )
-    usuarios.append(aluno3)
-    
-    # Professores
-    prof1 = Usuario.objects.create_user(
-        username='maria.prof',
-        password='Professor@123',
-        email='maria@sgea.local',
-        nome='Maria Professora Santos',
-        telefone='(61) 97777-7777',
-        perfil=PerfilChoices.PROFESSOR,
-        instituicao=InstituicaoChoices.UNB,
-    )
-    usuarios.append(prof1)
+    # Cada senha distinta é processada uma única vez; usuários com a mesma senha
+    # reutilizam o hash. O PBKDF2 roda em C sem o GIL, então os hashes saem em paralelo.
+    senhas = sorted({senha for _, senha, _ in USER_SPECS})
+    with ThreadPoolExecutor(max_workers=len(senhas)) as executor:
+        hashes = dict(zip(senhas, executor.map(make_password, senhas)))
     
-    prof2 = Usuario.objects.create_user(
-        username='joao.prof',
-        password='Professor@123',
-        email='joao@sgea.local',
-        nome='João Professor Oliveira',
-        telefone='(61) 98888-8888',
-        perfil=PerfilChoices.PROFESSOR,
-        instituicao=InstituicaoChoices.UCB,
-    )
-    usuarios.append(prof2)
-
-    # Usuários de Teste Solicitados
-    # Organizador
-    org_teste = Usuario.objects.create_user(
-        username='organizador',
-        password='Organizador@123',
-        email='organizador@sgea.com',
-        nome='Organizador de Teste',
-        telefone='(61) 99999-9999',
-        perfil=PerfilChoices.ORGANIZADOR,
-    )
-    usuarios.append(org_teste)
-
-    # Aluno
-    aluno_teste = Usuario.objects.create_user(
-        username='aluno',
-        password='Aluno@123',
-        email='aluno@sgea.com',
-        nome='Aluno de Teste',
-        telefone='(61) 98888-8888',
-        perfil=PerfilChoices.ALUNO,
-        instituicao=InstituicaoChoices.UNB,
-    )
-    usuarios.append(aluno_teste)
-
-    # Professor
-    prof_teste = Usuario.objects.create_user(
-        username='professor',
-        password='Professor@123',
-        email='professor@sgea.com',
-        nome='Professor de Teste',
-        telefone='(61) 97777-7777',
-        perfil=PerfilChoices.PROFESSOR,
-        instituicao=InstituicaoChoices.UNB,
-    )
-    usuarios.append(prof_teste)
+    usuarios = Usuario.objects.bulk_create([
+        Usuario(username=username, password=hashes[senha], **campos)
+        for username, senha, campos in USER_SPECS
+    ], batch_size=LOTE_INSERCAO)
     
     print(f"{len(usuarios)} usuarios criados.\n")
-    return {u.username: u for u in usuarios}
+    return SimpleNamespace(**{u.username.replace('.', '_'): u for u in usuarios})
 
 
 def criar_eventos(usuarios):
@@ -177,71 +257,17 @@ def criar_eventos(usuarios):
     print("Criando eventos...")
     
     hoje = date.today()
-    eventos = []
-    
-    # Evento passado
-    evento1 = Evento.objects.create(
-        tipo=TipoEventoChoices.PALESTRA,
-        data_inicio=hoje - timedelta(days=10),
-        data_fim=hoje - timedelta(days=10),
-        local='Auditório Central',
-        capacidade=200,
-        organizador=usuarios['carlos.org'],
-    )
-    eventos.append(evento1)
-    
-    # Evento em andamento
-    evento2 = Evento.objects.create(
-        tipo=TipoEventoChoices.WORKSHOP,
-        data_inicio=hoje - timedelta(days=1),
-        data_fim=hoje + timedelta(days=1),
-        local='Sala 301',
-        capacidade=30,
-        organizador=usuarios['julia.org'],
-    )
-    eventos.append(evento2)
-    
-    # Eventos futuros
-    evento3 = Evento.objects.create(
-        tipo=TipoEventoChoices.MINICURSO,
-        data_inicio=hoje + timedelta(days=7),
-        data_fim=hoje + timedelta(days=9),
-        local='Laboratório 202',
-        capacidade=25,
-        organizador=usuarios['carlos.org'],
-    )
-    eventos.append(evento3)
-    
-    evento4 = Evento.objects.create(
-        tipo=TipoEventoChoices.SEMINARIO,
-        data_inicio=hoje + timedelta(days=15),
-        data_fim=hoje + timedelta(days=17),
-        local='Auditório Norte',
-        capacidade=150,
-        organizador=usuarios['julia.org'],
-    )
-    eventos.append(evento4)
-    
-    evento5 = Evento.objects.create(
-        tipo=TipoEventoChoices.PALESTRA,
-        data_inicio=hoje + timedelta(days=30),
-        data_fim=hoje + timedelta(days=30),
-        local='Sala de Conferências',
-        capacidade=100,
-        organizador=usuarios['carlos.org'],
-    )
-    eventos.append(evento5)
-    
-    # Evento com capacidade baixa para testar limite
-    evento6 = Evento.objects.create(
-        tipo=TipoEventoChoices.WORKSHOP,
-        data_inicio=hoje + timedelta(days=20),
-        data_fim=hoje + timedelta(days=21),
-        local='Sala Pequena',
-        capacidade=5,
-        organizador=usuarios['julia.org'],
-    )
-    eventos.append(evento6)
+    eventos = Evento.objects.bulk_create([
+        Evento(
+            tipo=tipo,
+            data_inicio=hoje + timedelta(days=inicio),
+            data_fim=hoje + timedelta(days=fim),
+            local=local,
+            capacidade=capacidade,
+            organizador=getattr(usuarios, organizador),
+        )
+        for tipo, inicio, fim, local, capacidade, organizador in EVENT_SPECS
+    ], batch_size=LOTE_INSERCAO)
     
     print(f"{len(eventos)} eventos criados.\n")
     return eventos
@@ -251,100 +277,59 @@ def criar_inscricoes(eventos, usuarios):
     """Cria inscrições de exemplo."""
     print("Criando inscricoes...")
     
+    # (evento, participante, status, presenca_confirmada)
     inscricoes = []
     
     # Evento 1 (passado) - inscrições confirmadas com presença
-    inscricoes.append(Inscricao.objects.create(
-        evento=eventos[0],
-        participante=usuarios['bruno.aluno'],
-        status=InscricaoStatus.CONFIRMADA,
-        presenca_confirmada=True,
-    ))
-    
-    inscricoes.append(Inscricao.objects.create(
-        evento=eventos[0],
-        participante=usuarios['maria.prof'],
-        status=InscricaoStatus.CONFIRMADA,
-        presenca_confirmada=True,
-    ))
-    
-    inscricoes.append(Inscricao.objects.create(
-        evento=eventos[0],
-        participante=usuarios['ana.aluna'],
-        status=InscricaoStatus.CONFIRMADA,
-        presenca_confirmada=False,
-    ))
+    inscricoes.append((eventos[0], usuarios.bruno_aluno, InscricaoStatus.CONFIRMADA, True))
+    inscricoes.append((eventos[0], usuarios.maria_prof, InscricaoStatus.CONFIRMADA, True))
+    inscricoes.append((eventos[0], usuarios.ana_aluna, InscricaoStatus.CONFIRMADA, False))
     
     # Evento 2 (em andamento) - mix de status
-    inscricoes.append(Inscricao.objects.create(
-        evento=eventos[1],
-        participante=usuarios['pedro.aluno'],
-        status=InscricaoStatus.CONFIRMADA,
-        presenca_confirmada=True,
-    ))
-    
-    inscricoes.append(Inscricao.objects.create(
-        evento=eventos[1],
-        participante=usuarios['joao.prof'],
-        status=InscricaoStatus.CONFIRMADA,
-        presenca_confirmada=False,
-    ))
+    inscricoes.append((eventos[1], usuarios.pedro_aluno, InscricaoStatus.CONFIRMADA, True))
+    inscricoes.append((eventos[1], usuarios.joao_prof, InscricaoStatus.CONFIRMADA, False))
     
     # Evento 3 (futuro) - pendentes e confirmadas
-    inscricoes.append(Inscricao.objects.create(
-        evento=eventos[2],
-        participante=usuarios['bruno.aluno'],
-        status=InscricaoStatus.PENDENTE,
-        presenca_confirmada=False,
-    ))
-    
-    inscricoes.append(Inscricao.objects.create(
-        evento=eventos[2],
-        participante=usuarios['ana.aluna'],
-        status=InscricaoStatus.CONFIRMADA,
-        presenca_confirmada=False,
-    ))
+    inscricoes.append((eventos[2], usuarios.bruno_aluno, InscricaoStatus.PENDENTE, False))
+    inscricoes.append((eventos[2], usuarios.ana_aluna, InscricaoStatus.CONFIRMADA, False))
     
     # Evento 4 (futuro) - várias inscrições
-    inscricoes.append(Inscricao.objects.create(
-        evento=eventos[3],
-        participante=usuarios['maria.prof'],
-        status=InscricaoStatus.CONFIRMADA,
-        presenca_confirmada=False,
-    ))
-    
-    inscricoes.append(Inscricao.objects.create(
-        evento=eventos[3],
-        participante=usuarios['pedro.aluno'],
-        status=InscricaoStatus.PENDENTE,
-        presenca_confirmada=False,
-    ))
+    inscricoes.append((eventos[3], usuarios.maria_prof, InscricaoStatus.CONFIRMADA, False))
+    inscricoes.append((eventos[3], usuarios.pedro_aluno, InscricaoStatus.PENDENTE, False))
     
     # Evento 6 (capacidade baixa) - testar limite
-    inscricoes.append(Inscricao.objects.create(
-        evento=eventos[5],
-        participante=usuarios['bruno.aluno'],
-        status=InscricaoStatus.CONFIRMADA,
-        presenca_confirmada=False,
-    ))
-    
-    inscricoes.append(Inscricao.objects.create(
-        evento=eventos[5],
-        participante=usuarios['ana.aluna'],
-        status=InscricaoStatus.CONFIRMADA,
-        presenca_confirmada=False,
-    ))
+    inscricoes.append((eventos[5], usuarios.bruno_aluno, InscricaoStatus.CONFIRMADA, False))
+    inscricoes.append((eventos[5], usuarios.ana_aluna, InscricaoStatus.CONFIRMADA, False))
     
     # Inscrição cancelada
-    inscricoes.append(Inscricao.objects.create(
-        evento=eventos[4],
-        participante=usuarios['joao.prof'],
-        status=InscricaoStatus.CANCELADA,
-        presenca_confirmada=False,
-    ))
+    inscricoes.append((eventos[4], usuarios.joao_prof, InscricaoStatus.CANCELADA, False))
+    
+    # INSERT ... VALUES (...), (...) direto: um comando por lote de linhas, sem
+    # instâncias de Inscricao (nem full_clean) por linha. Os lotes mantêm o número
+    # de parâmetros abaixo do limite de 999 do SQLite.
+    qn = connection.ops.quote_name
+    colunas = ('evento_id', 'participante_id', 'status', 'presenca_confirmada', 'data_inscricao', 'atualizado_em')
+    placeholders = '({})'.format(', '.join(['%s'] * len(colunas)))
+    agora = connection.ops.adapt_datetimefield_value(timezone.now())
+    linhas = [
+        (evento.pk, participante.pk, status, presenca, agora, agora)
+        for evento, participante, status, presenca in inscricoes
+    ]
+    lote = min(LOTE_INSERCAO, 999 // len(colunas))
+    with connection.cursor() as cursor:
+        for inicio in range(0, len(linhas), lote):
+            parte = linhas[inicio:inicio + lote]
+            cursor.execute(
+                'INSERT INTO {} ({}) VALUES {}'.format(
+                    qn(Inscricao._meta.db_table),
+                    ', '.join(qn(coluna) for coluna in colunas),
+                    ', '.join([placeholders] * len(parte)),
+                ),
+                [valor for linha in parte for valor in linha],
+            )
     
     print(f"{len(inscricoes)} inscricoes criadas.\n")
-    return inscricoes
+    return Inscricao.objects.filter(evento__in=eventos)
 
 
 def criar_certificados(inscricoes, usuarios):
@@ -354,24 +339,30 @@ def criar_certificados(inscricoes, usuarios):
     certificados = []
     
     # Certificados para inscrições com presença confirmada
-    inscricoes_elegiveis = [i for i in inscricoes if i.status == InscricaoStatus.CONFIRMADA and i.presenca_confirmada]
+    inscricoes_elegiveis = inscricoes.filter(
+        status=InscricaoStatus.CONFIRMADA,
+        presenca_confirmada=True,
+    ).select_related('evento__organizador')
     
     for inscricao in inscricoes_elegiveis:
+        evento = inscricao.evento
+        
         # Determinar emissor (organizador do evento)
-        emissor = inscricao.evento.organizador
+        emissor = evento.organizador
         
         # Calcular carga horária baseada na duração do evento
-        dias = (inscricao.evento.data_fim - inscricao.evento.data_inicio).days + 1
+        dias = (evento.data_fim - evento.data_inicio).days + 1
         carga_horaria = dias * 4  # 4 horas por dia
         
-        cert = Certificado.objects.create(
+        certificados.append(Certificado(
             inscricao=inscricao,
             emitido_por=emissor,
             carga_horaria=carga_horaria,
-            validade=inscricao.evento.data_fim + timedelta(days=365),  # 1 ano
-            observacoes=f"Participação confirmada em {inscricao.evento.get_tipo_display()}.",
-        )
-        certificados.append(cert)
+            validade=evento.data_fim + timedelta(days=365),  # 1 ano
+            observacoes=f"Participação confirmada em {evento.get_tipo_display()}.",
+        ))
+    
+    certificados = Certificado.objects.bulk_create(certificados, batch_size=LOTE_INSERCAO)
     
     print(f"{len(certificados)} certificados emitidos.\n")
     return certificados
@@ -383,14 +374,23 @@ def main():
     print("=" * 60 + "\n")
     
     try:
-        # Limpar dados existentes
-        limpar_dados()
+        # Abrir a conexão uma única vez, antes de qualquer etapa
+        connection.ensure_connection()
         
-        # Criar dados
-        usuarios = criar_usuarios()
-        eventos = criar_eventos(usuarios)
-        inscricoes = criar_inscricoes(eventos, usuarios)
-        certificados = criar_certificados(inscricoes, usuarios)
+        # Com --fast, um snapshot válido substitui a carga completa
+        restaurado = '--fast' in sys.argv[1:] and restaurar_snapshot()
+        if not restaurado:
+            # Limpar dados existentes
+            limpar_dados()
+            
+            # Criar dados (uma única transação: um commit e nada pela metade em caso de erro)
+            with desativar_sinais(), transaction.atomic():
+                usuarios = criar_usuarios()
+                eventos = criar_eventos(usuarios)
+                inscricoes = criar_inscricoes(eventos, usuarios)
+                certificados = criar_certificados(inscricoes, usuarios)
+            
+            salvar_snapshot()
         
         # Resumo
         print("=" * 60)
@@ -1,5 +1,7 @@
 """Configurações base do projeto Django."""
 
+import os
+import sys
 from pathlib import Path
 
 # Build paths inside the project like  this: BASE_DIR / 'subdir'.
@@ -17,11 +19,15 @@ DEBUG = True
 
 ALLOWED_HOSTS = []
 
+# Django admin (/admin/). Set ADMIN_ENABLED=0 to leave it out of the app
+# registry and the URLconf, so workers skip loading the admin modules.
+ADMIN_ENABLED = os.environ.get('ADMIN_ENABLED', '1') != '0'
+
 
 # Application definition
 
 INSTALLED_APPS = [
-    'django.contrib.admin',
+    *(['django.contrib.admin'] if ADMIN_ENABLED else []),
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
@@ -57,13 +63,19 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Parse each template once per process and reuse the compiled NodeList
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
@@ -73,6 +85,10 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": str(BASE_DIR / "db.sqlite3"),
+        # Keep connections open between requests (and across the work of a
+        # long-running script); a health check runs before reusing one.
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
@@ -95,6 +111,10 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# The test suite creates users in almost every setUp; PBKDF2 would dominate its runtime
+if sys.argv[1:2] == ['test']:
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
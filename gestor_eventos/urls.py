@@ -14,8 +14,7 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-from django.contrib import admin
-from django.urls import path
+from django.urls import path, re_path
 from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework.authtoken.views import obtain_auth_token
@@ -60,6 +59,22 @@ from api.endpoints import (
     EventoInscricoesListView,
 )
 
+# Views mounted on more than one URL: build each view function once
+_autenticacao = AutenticacaoView.as_view()
+_cadastro_usuario = CadastroUsuarioView.as_view()
+_cadastro_evento = CadastroEventoView.as_view()
+_inscricao_usuario = InscricaoUsuarioView.as_view()
+_emissao_certificado = EmissaoCertificadoView.as_view()
+
+# Legacy prototype routes: (URL segment, view, name suffix)
+PROTOTIPOS = [
+    ('cadastro-usuarios', _cadastro_usuario, 'cadastro-usuario'),
+    ('cadastro-eventos', _cadastro_evento, 'cadastro-evento'),
+    ('inscricao-usuarios', _inscricao_usuario, 'inscricao-usuario'),
+    ('emissao-certificados', _emissao_certificado, 'emissao-certificado'),
+    ('autenticacao', _autenticacao, 'autenticacao'),
+]
+
 urlpatterns = [
     # ============================================================================
     # API ENDPOINTS
@@ -99,56 +114,39 @@ urlpatterns = [
     # WEB VIEWS
     # ============================================================================
     
-    path('', AutenticacaoView.as_view(), name='home'),
-    path('login/', AutenticacaoView.as_view(), name='login'),
-    path('signup/', SignupView.as_view(), name='signup'),
-    path('logout/', logout_view, name='logout'),
+    # Ordered by expected traffic: the resolver tries patterns top to bottom.
+    # Event pages use plain regexes; the views accept evento_id as a string.
+    path('', _autenticacao, name='home'),
+    path('login/', _autenticacao, name='login'),
     path('dashboard/', DashboardView.as_view(), name='dashboard'),
-    
-    path('cadastro-usuarios/', CadastroUsuarioView.as_view(), name='cadastro-usuario'),
-    path('cadastro-eventos/', CadastroEventoView.as_view(), name='cadastro-evento'),
-    path('inscricao/', InscricaoUsuarioView.as_view(), name='inscricao-usuario'),
+    re_path(r'^eventos/(?P<evento_id>[0-9]+)/$', DetalhesEventoView.as_view(), name='detalhes-evento'),
+    re_path(r'^eventos/(?P<evento_id>[0-9]+)/editar/$', EditarEventoView.as_view(), name='editar-evento'),
+    re_path(r'^eventos/(?P<evento_id>[0-9]+)/deletar/$', DeletarEventoView.as_view(), name='deletar-evento'),
+    path('inscricao/', _inscricao_usuario, name='inscricao-usuario'),
     path('presenca/', PresencaView.as_view(), name='presenca'),
-    path('certificados/', EmissaoCertificadoView.as_view(), name='emissao-certificado'),
+    path('certificados/', _emissao_certificado, name='emissao-certificado'),
     path('certificados/<int:pk>/pdf/', GerarCertificadoPDFView.as_view(), name='gerar-certificado-pdf'),
     path('meus-eventos/', MeusEventosView.as_view(), name='meus-eventos'),
     path('perfil/', PerfilUsuarioView.as_view(), name='perfil-usuario'),
+    path('cadastro-usuarios/', _cadastro_usuario, name='cadastro-usuario'),
+    path('cadastro-eventos/', _cadastro_evento, name='cadastro-evento'),
+    path('signup/', SignupView.as_view(), name='signup'),
+    path('logout/', logout_view, name='logout'),
     path('audit-logs/', AuditLogView.as_view(), name='audit-logs'),
-    path('eventos/<int:evento_id>/', DetalhesEventoView.as_view(), name='detalhes-evento'),
-    path('eventos/<int:evento_id>/editar/', EditarEventoView.as_view(), name='editar-evento'),
-    path('eventos/<int:evento_id>/deletar/', DeletarEventoView.as_view(), name='deletar-evento'),
     
     # Prototypes (legacy)
-    path(
-        'prototipos/cadastro-usuarios/',
-        CadastroUsuarioView.as_view(),
-        name='prototype-cadastro-usuario',
-    ),
-    path(
-        'prototipos/cadastro-eventos/',
-        CadastroEventoView.as_view(),
-        name='prototype-cadastro-evento',
-    ),
-    path(
-        'prototipos/inscricao-usuarios/',
-        InscricaoUsuarioView.as_view(),
-        name='prototype-inscricao-usuario',
-    ),
-    path(
-        'prototipos/emissao-certificados/',
-        EmissaoCertificadoView.as_view(),
-        name='prototype-emissao-certificado',
-    ),
-    path(
-        'prototipos/autenticacao/',
-        AutenticacaoView.as_view(),
-        name='prototype-autenticacao',
-    ),
-    
-    # Admin
-    path('admin/', admin.site.urls),
+    *[
+        path(f'prototipos/{segmento}/', view, name=f'prototype-{nome}')
+        for segmento, view, nome in PROTOTIPOS
+    ],
 ]
 
+# Admin (imported only when enabled, see settings.ADMIN_ENABLED)
+if settings.ADMIN_ENABLED:
+    from django.contrib import admin
+
+    urlpatterns.append(path('admin/', admin.site.urls))
+
 # Serve media files in development
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
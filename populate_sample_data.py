@@ -7,7 +7,9 @@ Cobre todas as operações do sistema: usuários, eventos, inscrições, presen
 import os
 import sys
 import django
+from collections import Counter
 from datetime import date, time, timedelta
+from functools import wraps
 from django.utils import timezone
 
 # Setup Django
@@ -19,15 +21,80 @@ from api.models import (
     Usuario, Evento, Inscricao, Certificado,
     PerfilChoices, InstituicaoChoices, TipoEventoChoices, InscricaoStatus
 )
-from django.db import transaction
+from api.signals import desativar_sinais
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.db.models import Count, Q
 
 
+# (índice do evento, grupo de participantes, fatia do grupo, status, presença confirmada)
+INSCRICAO_SPECS = [
+    # Evento 1 (passado): 8 confirmadas com presença, 2 confirmadas sem presença, 1 cancelada
+    (0, 'alunos', slice(0, 8), InscricaoStatus.CONFIRMADA, True),
+    (0, 'professores', slice(0, 2), InscricaoStatus.CONFIRMADA, False),
+    (0, 'professores', slice(2, 3), InscricaoStatus.CANCELADA, False),
+    # Evento 2 (passado recente): 5 confirmadas com presença, 3 pendentes
+    (1, 'alunos', slice(0, 5), InscricaoStatus.CONFIRMADA, True),
+    (1, 'alunos', slice(5, 8), InscricaoStatus.PENDENTE, False),
+    # Evento 3 (em andamento): 10 confirmadas, 2 pendentes
+    (2, 'alunos', slice(0, 6), InscricaoStatus.CONFIRMADA, False),
+    (2, 'professores', slice(0, 4), InscricaoStatus.CONFIRMADA, False),
+    (2, 'alunos', slice(6, 8), InscricaoStatus.PENDENTE, False),
+    # Evento 4 (futuro próximo): até 15 confirmadas, depois até 5 pendentes
+    (3, 'todos', slice(0, 15), InscricaoStatus.CONFIRMADA, False),
+    (3, 'todos', slice(15, 20), InscricaoStatus.PENDENTE, False),
+    # Evento 5 (futuro): 6 confirmadas, 4 pendentes
+    (4, 'alunos', slice(0, 6), InscricaoStatus.CONFIRMADA, False),
+    (4, 'alunos', slice(6, 8), InscricaoStatus.PENDENTE, False),
+    (4, 'professores', slice(0, 2), InscricaoStatus.PENDENTE, False),
+    # Evento 6 (futuro, quase lotado): todos os alunos e 2 professores confirmados
+    (5, 'alunos', slice(None), InscricaoStatus.CONFIRMADA, False),
+    (5, 'professores', slice(0, 2), InscricaoStatus.CONFIRMADA, False),
+    # Evento 7 (futuro distante): 3 pendentes
+    (6, 'alunos', slice(0, 3), InscricaoStatus.PENDENTE, False),
+]
+
+
+# Rótulos (singular, plural) do resumo por evento
+ROTULOS_STATUS = {
+    InscricaoStatus.CONFIRMADA: ('confirmada', 'confirmadas'),
+    InscricaoStatus.PENDENTE: ('pendente', 'pendentes'),
+    InscricaoStatus.CANCELADA: ('cancelada', 'canceladas'),
+}
+ROTULOS_PRESENCA = {
+    (InscricaoStatus.CONFIRMADA, True): ('confirmada c/ presença', 'confirmadas c/ presença'),
+    (InscricaoStatus.CONFIRMADA, False): ('confirmada s/ presença', 'confirmadas s/ presença'),
+}
+
+
+def _fase(func):
+    """Descarrega a saída acumulada ao fim de cada fase do script."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sys.stdout.flush()
+    return wrapper
+
+
+@_fase
 def limpar_dados():
     """Remove todos os dados existentes."""
     print("\n" + "="*70)
     print(" LIMPANDO DADOS EXISTENTES")
     print("="*70)
     
+    if connection.vendor == 'postgresql' and os.environ.get('ALLOW_TRUNCATE'):
+        # Um único TRUNCATE em vez de DELETEs encadeados. Só com ALLOW_TRUNCATE:
+        # o CASCADE também esvazia as tabelas que apontam para estas (auditoria, tokens).
+        modelos = [Certificado, Inscricao, Evento, Usuario]
+        tabelas = ", ".join(connection.ops.quote_name(m._meta.db_table) for m in modelos)
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {tabelas} RESTART IDENTITY CASCADE")
+        print(f"✓ Tabelas truncadas: {tabelas}")
+        return
+    
     with transaction.atomic():
         # Ordem importa devido às foreign keys
         count_certs = Certificado.objects.all().delete()[0]
@@ -41,6 +108,7 @@ def limpar_dados():
         print(f"✓ {count_users} usuários removidos")
 
 
+@_fase
 def criar_usuarios():
     """Cria usuários de exemplo para todos os perfis."""
     print("\n" + "="*70)
@@ -135,16 +203,22 @@ def criar_usuarios():
         ('mariana.aluna', 'Mariana Silva Costa', 'mariana@aluna.ifb.edu.br', InstituicaoChoices.IFB, '(61) 96666-8888'),
     ]
     
-    for username, nome, email, instituicao, telefone in alunos_data:
-        aluno = Usuario.objects.create_user(
+    # Todos os alunos usam a mesma senha: hash calculado uma única vez
+    aluno_hash = make_password('aluno123!')
+    alunos = [
+        Usuario(
             username=username,
-            password='aluno123!',
+            password=aluno_hash,
             email=email,
             nome=nome,
             telefone=telefone,
             perfil=PerfilChoices.ALUNO,
             instituicao=instituicao
         )
+        for username, nome, email, instituicao, telefone in alunos_data
+    ]
+    
+    for aluno in Usuario.objects.bulk_create(alunos, batch_size=500):
         usuarios.append(aluno)
         print(f"✓ ALUNO criado: {aluno.username}")
     
@@ -152,402 +226,285 @@ def criar_usuarios():
     return usuarios
 
 
+@_fase
 def criar_eventos(usuarios):
     """Cria eventos de exemplo de todos os tipos."""
     print("\n" + "="*70)
     print(" CRIANDO EVENTOS")
     print("="*70)
     
-    # Buscar organizadores e professores
-    org1 = Usuario.objects.get(username='carlos.org')
-    org2 = Usuario.objects.get(username='ana.organizadora')
-    admin = Usuario.objects.get(username='admin')
-    prof1 = Usuario.objects.get(username='maria.prof')
-    prof2 = Usuario.objects.get(username='joao.professor')
-    prof3 = Usuario.objects.get(username='patricia.prof')
+    # Organizadores e professores, a partir dos usuários recém-criados
+    por_username = {u.username: u for u in usuarios}
+    org1 = por_username['carlos.org']
+    org2 = por_username['ana.organizadora']
+    admin = por_username['admin']
+    prof1 = por_username['maria.prof']
+    prof2 = por_username['joao.professor']
+    prof3 = por_username['patricia.prof']
     
-    eventos = []
     hoje = date.today()
-    
-    # Evento 1: PALESTRA (passado, com inscrições e certificados)
-    evento1 = Evento.objects.create(
-        tipo=TipoEventoChoices.PALESTRA,
-        titulo='Inteligência Artificial na Educação',
-        data_inicio=hoje - timedelta(days=30),
-        data_fim=hoje - timedelta(days=30),
-        horario=time(14, 0),
-        local='Auditório Central - UnB',
-        capacidade=100,
-        organizador=org1,
-        professor_responsavel=prof1
-    )
-    eventos.append(evento1)
-    print(f"✓ PALESTRA criada: {evento1.titulo}")
-    
-    # Evento 2: WORKSHOP (passado recente, com inscrições)
-    evento2 = Evento.objects.create(
-        tipo=TipoEventoChoices.WORKSHOP,
-        titulo='Desenvolvimento Web com Django',
-        data_inicio=hoje - timedelta(days=7),
-        data_fim=hoje - timedelta(days=5),
-        horario=time(9, 0),
-        local='Laboratório de Informática - IFB',
-        capacidade=30,
-        organizador=org2,
-        professor_responsavel=prof2
-    )
-    eventos.append(evento2)
-    print(f"✓ WORKSHOP criado: {evento2.titulo}")
-    
-    # Evento 3: MINICURSO (em andamento)
-    evento3 = Evento.objects.create(
-        tipo=TipoEventoChoices.MINICURSO,
-        titulo='Python para Análise de Dados',
-        data_inicio=hoje - timedelta(days=2),
-        data_fim=hoje + timedelta(days=3),
-        horario=time(19, 0),
-        local='Sala 301 - CEUB',
-        capacidade=25,
-        organizador=org1,
-        professor_responsavel=prof3
-    )
-    eventos.append(evento3)
-    print(f"✓ MINICURSO criado: {evento3.titulo}")
-    
-    # Evento 4: SEMINÁRIO (futuro próximo)
-    evento4 = Evento.objects.create(
-        tipo=TipoEventoChoices.SEMINARIO,
-        titulo='Inovação e Tecnologia no Ensino Superior',
-        data_inicio=hoje + timedelta(days=5),
-        data_fim=hoje + timedelta(days=5),
-        horario=time(10, 0),
-        local='Centro de Convenções',
-        capacidade=200,
-        organizador=admin,
-        professor_responsavel=prof1
-    )
-    eventos.append(evento4)
-    print(f"✓ SEMINÁRIO criado: {evento4.titulo}")
-    
-    # Evento 5: PALESTRA (futuro)
-    evento5 = Evento.objects.create(
-        tipo=TipoEventoChoices.PALESTRA,
-        titulo='Metodologias Ágeis em Projetos Acadêmicos',
-        data_inicio=hoje + timedelta(days=15),
-        data_fim=hoje + timedelta(days=15),
-        horario=time(16, 0),
-        local='Auditório - IESB',
-        capacidade=80,
-        organizador=org2,
-        professor_responsavel=prof2
-    )
-    eventos.append(evento5)
-    print(f"✓ PALESTRA criada: {evento5.titulo}")
-    
-    # Evento 6: WORKSHOP (futuro, quase lotado)
-    evento6 = Evento.objects.create(
-        tipo=TipoEventoChoices.WORKSHOP,
-        titulo='Segurança da Informação e Privacidade',
-        data_inicio=hoje + timedelta(days=20),
-        data_fim=hoje + timedelta(days=21),
-        horario=time(14, 0),
-        local='Lab. Segurança - UnB',
-        capacidade=20,
-        organizador=org1,
-        professor_responsavel=prof3
-    )
-    eventos.append(evento6)
-    print(f"✓ WORKSHOP criado: {evento6.titulo}")
-    
-    # Evento 7: OUTRO (futuro distante)
-    evento7 = Evento.objects.create(
-        tipo=TipoEventoChoices.OUTRO,
-        titulo='Hackathon Acadêmico 2025',
-        data_inicio=hoje + timedelta(days=60),
-        data_fim=hoje + timedelta(days=62),
-        horario=time(8, 0),
-        local='Campus Tecnológico',
-        capacidade=50,
-        organizador=admin,
-        professor_responsavel=prof1
-    )
-    eventos.append(evento7)
-    print(f"✓ OUTRO evento criado: {evento7.titulo}")
+    eventos = [
+        # Evento 1: PALESTRA (passado, com inscrições e certificados)
+        Evento(
+            tipo=TipoEventoChoices.PALESTRA,
+            titulo='Inteligência Artificial na Educação',
+            data_inicio=hoje - timedelta(days=30),
+            data_fim=hoje - timedelta(days=30),
+            horario=time(14, 0),
+            local='Auditório Central - UnB',
+            capacidade=100,
+            organizador=org1,
+            professor_responsavel=prof1
+        ),
+        # Evento 2: WORKSHOP (passado recente, com inscrições)
+        Evento(
+            tipo=TipoEventoChoices.WORKSHOP,
+            titulo='Desenvolvimento Web com Django',
+            data_inicio=hoje - timedelta(days=7),
+            data_fim=hoje - timedelta(days=5),
+            horario=time(9, 0),
+            local='Laboratório de Informática - IFB',
+            capacidade=30,
+            organizador=org2,
+            professor_responsavel=prof2
+        ),
+        # Evento 3: MINICURSO (em andamento)
+        Evento(
+            tipo=TipoEventoChoices.MINICURSO,
+            titulo='Python para Análise de Dados',
+            data_inicio=hoje - timedelta(days=2),
+            data_fim=hoje + timedelta(days=3),
+            horario=time(19, 0),
+            local='Sala 301 - CEUB',
+            capacidade=25,
+            organizador=org1,
+            professor_responsavel=prof3
+        ),
+        # Evento 4: SEMINÁRIO (futuro próximo)
+        Evento(
+            tipo=TipoEventoChoices.SEMINARIO,
+            titulo='Inovação e Tecnologia no Ensino Superior',
+            data_inicio=hoje + timedelta(days=5),
+            data_fim=hoje + timedelta(days=5),
+            horario=time(10, 0),
+            local='Centro de Convenções',
+            capacidade=200,
+            organizador=admin,
+            professor_responsavel=prof1
+        ),
+        # Evento 5: PALESTRA (futuro)
+        Evento(
+            tipo=TipoEventoChoices.PALESTRA,
+            titulo='Metodologias Ágeis em Projetos Acadêmicos',
+            data_inicio=hoje + timedelta(days=15),
+            data_fim=hoje + timedelta(days=15),
+            horario=time(16, 0),
+            local='Auditório - IESB',
+            capacidade=80,
+            organizador=org2,
+            professor_responsavel=prof2
+        ),
+        # Evento 6: WORKSHOP (futuro, quase lotado)
+        Evento(
+            tipo=TipoEventoChoices.WORKSHOP,
+            titulo='Segurança da Informação e Privacidade',
+            data_inicio=hoje + timedelta(days=20),
+            data_fim=hoje + timedelta(days=21),
+            horario=time(14, 0),
+            local='Lab. Segurança - UnB',
+            capacidade=20,
+            organizador=org1,
+            professor_responsavel=prof3
+        ),
+        # Evento 7: OUTRO (futuro distante)
+        Evento(
+            tipo=TipoEventoChoices.OUTRO,
+            titulo='Hackathon Acadêmico 2025',
+            data_inicio=hoje + timedelta(days=60),
+            data_fim=hoje + timedelta(days=62),
+            horario=time(8, 0),
+            local='Campus Tecnológico',
+            capacidade=50,
+            organizador=admin,
+            professor_responsavel=prof1
+        ),
+    ]
+    eventos = Evento.objects.bulk_create(eventos)
+    for evento in eventos:
+        print(f"✓ {evento.get_tipo_display().upper()} criado: {evento.titulo}")
     
     print(f"\n✓ Total: {len(eventos)} eventos criados")
     return eventos
 
 
+def _gerar_inscricoes(eventos, grupos):
+    """Gera as inscrições descritas em INSCRICAO_SPECS (sem salvar)."""
+    for indice, grupo, fatia, status, presenca in INSCRICAO_SPECS:
+        for participante in grupos[grupo][fatia]:
+            yield Inscricao(
+                evento=eventos[indice],
+                participante=participante,
+                status=status,
+                presenca_confirmada=presenca,
+            )
+
+
+def _suporta_copy():
+    """COPY FROM STDIN só está disponível no PostgreSQL com psycopg 3."""
+    if connection.vendor != 'postgresql':
+        return False
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+    return is_psycopg3
+
+
+def _copiar_inscricoes(inscricoes):
+    """Insere as inscrições com COPY FROM STDIN, sem montar um INSERT."""
+    qn = connection.ops.quote_name
+    colunas = ('evento_id', 'participante_id', 'status', 'presenca_confirmada', 'data_inscricao', 'atualizado_em')
+    sql = f"COPY {qn(Inscricao._meta.db_table)} ({', '.join(map(qn, colunas))}) FROM STDIN"
+    agora = timezone.now()
+    with connection.cursor() as cursor:
+        with cursor.copy(sql) as copy:
+            for inscricao in inscricoes:
+                copy.write_row((
+                    inscricao.evento_id,
+                    inscricao.participante_id,
+                    str(inscricao.status),
+                    inscricao.presenca_confirmada,
+                    agora,
+                    agora,
+                ))
+
+
+@_fase
 def criar_inscricoes(usuarios, eventos):
     """Cria inscrições de exemplo com diferentes status."""
     print("\n" + "="*70)
     print(" CRIANDO INSCRIÇÕES")
     print("="*70)
     
-    # Buscar alunos e professores
-    alunos = Usuario.objects.filter(perfil=PerfilChoices.ALUNO)
-    professores = Usuario.objects.filter(perfil=PerfilChoices.PROFESSOR)
-    
-    inscricoes = []
-    
-    # Evento 1 (passado): 8 confirmadas com presença, 2 confirmadas sem presença, 1 cancelada
-    evento1 = eventos[0]
-    participantes_e1 = list(alunos[:8])
-    
-    for i, participante in enumerate(participantes_e1):
-        inscricao = Inscricao.objects.create(
-            evento=evento1,
-            participante=participante,
-            status=InscricaoStatus.CONFIRMADA,
-            presenca_confirmada=True  # Primeiros 8 com presença
+    # Buscar alunos e professores uma única vez (fatias abaixo não voltam ao banco).
+    # Ordem de criação, para que as fatias sejam determinísticas.
+    alunos = list(Usuario.objects.filter(perfil=PerfilChoices.ALUNO).order_by('pk'))
+    professores = list(Usuario.objects.filter(perfil=PerfilChoices.PROFESSOR).order_by('pk'))
+    grupos = {'alunos': alunos, 'professores': professores, 'todos': alunos + professores}
+    
+    if _suporta_copy():
+        _copiar_inscricoes(_gerar_inscricoes(eventos, grupos))
+        inscricoes = list(Inscricao.objects.filter(evento__in=eventos).order_by('pk'))
+    else:
+        inscricoes = Inscricao.objects.bulk_create(_gerar_inscricoes(eventos, grupos), batch_size=500)
+    
+    for evento in eventos:
+        do_evento = [i for i in inscricoes if i.evento_id == evento.pk]
+        if not do_evento:
+            continue
+        resumo = Counter((i.status, i.presenca_confirmada) for i in do_evento)
+        # Presença só é detalhada quando o evento já tem alguma confirmada
+        rotulos = ROTULOS_PRESENCA if (InscricaoStatus.CONFIRMADA, True) in resumo else ROTULOS_STATUS
+        detalhes = ", ".join(
+            f"{n} {rotulos.get(chave, ROTULOS_STATUS[chave[0]])[n != 1]}"
+            for chave, n in resumo.items()
         )
-        inscricoes.append(inscricao)
-    
-    # Mais 2 confirmadas sem presença
-    inscricao = Inscricao.objects.create(
-        evento=evento1,
-        participante=professores[0],
-        status=InscricaoStatus.CONFIRMADA,
-        presenca_confirmada=False
-    )
-    inscricoes.append(inscricao)
-    
-    inscricao = Inscricao.objects.create(
-        evento=evento1,
-        participante=professores[1],
-        status=InscricaoStatus.CONFIRMADA,
-        presenca_confirmada=False
-    )
-    inscricoes.append(inscricao)
-    
-    # 1 cancelada
-    inscricao = Inscricao.objects.create(
-        evento=evento1,
-        participante=professores[2],
-        status=InscricaoStatus.CANCELADA,
-        presenca_confirmada=False
-    )
-    inscricoes.append(inscricao)
-    
-    print(f"✓ Evento '{evento1.titulo}': 11 inscrições (8 confirmadas c/ presença, 2 confirmadas s/ presença, 1 cancelada)")
-    
-    # Evento 2 (passado recente): 5 confirmadas com presença, 3 pendentes
-    evento2 = eventos[1]
-    
-    for participante in alunos[:5]:
-        inscricao = Inscricao.objects.create(
-            evento=evento2,
-            participante=participante,
-            status=InscricaoStatus.CONFIRMADA,
-            presenca_confirmada=True
-        )
-        inscricoes.append(inscricao)
-    
-    for participante in alunos[5:8]:
-        inscricao = Inscricao.objects.create(
-            evento=evento2,
-            participante=participante,
-            status=InscricaoStatus.PENDENTE,
-            presenca_confirmada=False
-        )
-        inscricoes.append(inscricao)
-    
-    print(f"✓ Evento '{evento2.titulo}': 8 inscrições (5 confirmadas c/ presença, 3 pendentes)")
-    
-    # Evento 3 (em andamento): 10 confirmadas, 2 pendentes
-    evento3 = eventos[2]
-    
-    for participante in list(alunos[:6]) + list(professores[:4]):
-        inscricao = Inscricao.objects.create(
-            evento=evento3,
-            participante=participante,
-            status=InscricaoStatus.CONFIRMADA,
-            presenca_confirmada=False  # Evento ainda em andamento
-        )
-        inscricoes.append(inscricao)
-    
-    for participante in alunos[6:8]:
-        inscricao = Inscricao.objects.create(
-            evento=evento3,
-            participante=participante,
-            status=InscricaoStatus.PENDENTE,
-            presenca_confirmada=False
-        )
-        inscricoes.append(inscricao)
-    
-    print(f"✓ Evento '{evento3.titulo}': 12 inscrições (10 confirmadas, 2 pendentes)")
-    
-    # Evento 4 (futuro próximo): 15 confirmadas, 5 pendentes
-    evento4 = eventos[3]
-    
-    todos_participantes = list(alunos) + list(professores)
-    for participante in todos_participantes[:15]:
-        inscricao = Inscricao.objects.create(
-            evento=evento4,
-            participante=participante,
-            status=InscricaoStatus.CONFIRMADA,
-            presenca_confirmada=False
-        )
-        inscricoes.append(inscricao)
-    
-    for i in range(5):
-        if i < len(todos_participantes) - 15:
-            inscricao = Inscricao.objects.create(
-                evento=evento4,
-                participante=todos_participantes[15 + i],
-                status=InscricaoStatus.PENDENTE,
-                presenca_confirmada=False
-            )
-            inscricoes.append(inscricao)
-    
-    print(f"✓ Evento '{evento4.titulo}': ~20 inscrições (15 confirmadas, 5 pendentes)")
-    
-    # Evento 5 (futuro): 6 confirmadas, 4 pendentes
-    evento5 = eventos[4]
-    
-    for participante in alunos[:6]:
-        inscricao = Inscricao.objects.create(
-            evento=evento5,
-            participante=participante,
-            status=InscricaoStatus.CONFIRMADA,
-            presenca_confirmada=False
-        )
-        inscricoes.append(inscricao)
-    
-    for participante in alunos[6:8]:
-        inscricao = Inscricao.objects.create(
-            evento=evento5,
-            participante=participante,
-            status=InscricaoStatus.PENDENTE,
-            presenca_confirmada=False
-        )
-        inscricoes.append(inscricao)
-    
-    for participante in professores[:2]:
-        inscricao = Inscricao.objects.create(
-            evento=evento5,
-            participante=participante,
-            status=InscricaoStatus.PENDENTE,
-            presenca_confirmada=False
-        )
-        inscricoes.append(inscricao)
-    
-    print(f"✓ Evento '{evento5.titulo}': 10 inscrições (6 confirmadas, 4 pendentes)")
-    
-    # Evento 6 (futuro, quase lotado): 18 confirmadas (capacidade 20)
-    evento6 = eventos[5]
-    
-    participantes_e6 = list(alunos) + list(professores[:2])
-    for participante in participantes_e6[:18]:
-        inscricao = Inscricao.objects.create(
-            evento=evento6,
-            participante=participante,
-            status=InscricaoStatus.CONFIRMADA,
-            presenca_confirmada=False
-        )
-        inscricoes.append(inscricao)
-    
-    print(f"✓ Evento '{evento6.titulo}': 18 inscrições (18 confirmadas - quase lotado!)")
-    
-    # Evento 7 (futuro distante): 3 pendentes
-    evento7 = eventos[6]
-    
-    for participante in alunos[:3]:
-        inscricao = Inscricao.objects.create(
-            evento=evento7,
-            participante=participante,
-            status=InscricaoStatus.PENDENTE,
-            presenca_confirmada=False
-        )
-        inscricoes.append(inscricao)
-    
-    print(f"✓ Evento '{evento7.titulo}': 3 inscrições (3 pendentes)")
+        print(f"✓ Evento '{evento.titulo}': {len(do_evento)} inscrições ({detalhes})")
     
     print(f"\n✓ Total: {len(inscricoes)} inscrições criadas")
     return inscricoes
 
 
-def criar_certificados():
+@_fase
+def criar_certificados(eventos):
     """Cria certificados para participantes com presença confirmada."""
     print("\n" + "="*70)
     print(" CRIANDO CERTIFICADOS")
     print("="*70)
     
-    # Buscar organizadores
-    org1 = Usuario.objects.get(username='carlos.org')
-    org2 = Usuario.objects.get(username='ana.organizadora')
-    admin = Usuario.objects.get(username='admin')
+    evento1, evento2 = eventos[0], eventos[1]
+    # Organizadores (já carregados junto com os eventos)
+    org1 = evento1.organizador
+    org2 = evento2.organizador
     
     # Certificados para evento 1 (8 participantes com presença)
     inscricoes_evento1 = Inscricao.objects.filter(
-        evento__titulo='Inteligência Artificial na Educação',
+        evento_id=evento1.pk,
         status=InscricaoStatus.CONFIRMADA,
         presenca_confirmada=True
-    )
+    ).select_related('evento', 'participante')
     
     certificados = []
     for inscricao in inscricoes_evento1:
-        certificado = Certificado.objects.create(
+        certificados.append(Certificado(
             inscricao=inscricao,
             emitido_por=org1,
             carga_horaria=4,
             validade=date.today() + timedelta(days=730),  # 2 anos
             observacoes='Certificado de participação em palestra sobre IA na Educação.'
-        )
-        certificados.append(certificado)
-    
-    print(f"✓ {len(certificados)} certificados criados para evento 'Inteligência Artificial na Educação'")
+        ))
+    count_evento1 = len(certificados)
     
     # Certificados para evento 2 (5 participantes com presença)
     inscricoes_evento2 = Inscricao.objects.filter(
-        evento__titulo='Desenvolvimento Web com Django',
+        evento_id=evento2.pk,
         status=InscricaoStatus.CONFIRMADA,
         presenca_confirmada=True
-    )
+    ).select_related('evento', 'participante')
     
-    count = 0
     for inscricao in inscricoes_evento2:
-        certificado = Certificado.objects.create(
+        certificados.append(Certificado(
             inscricao=inscricao,
             emitido_por=org2,
             carga_horaria=12,
             validade=date.today() + timedelta(days=730),
             observacoes='Certificado de participação em workshop de desenvolvimento web.'
-        )
-        certificados.append(certificado)
-        count += 1
+        ))
+    count = len(certificados) - count_evento1
+    
+    certificados = Certificado.objects.bulk_create(certificados, batch_size=500)
     
-    print(f"✓ {count} certificados criados para evento 'Desenvolvimento Web com Django'")
+    print(f"✓ {count_evento1} certificados criados para evento '{evento1.titulo}'")
+    print(f"✓ {count} certificados criados para evento '{evento2.titulo}'")
     
     print(f"\n✓ Total: {len(certificados)} certificados emitidos")
     return certificados
 
 
+@_fase
 def imprimir_resumo():
     """Imprime resumo dos dados criados."""
     print("\n" + "="*70)
     print(" RESUMO DOS DADOS CRIADOS")
     print("="*70)
     
+    # Uma consulta agregada por modelo em vez de um COUNT por categoria
+    por_perfil = dict(Usuario.objects.values_list('perfil').annotate(n=Count('id')).order_by())
+    por_tipo = dict(Evento.objects.values_list('tipo').annotate(n=Count('id')).order_by())
+    inscricoes = Inscricao.objects.aggregate(
+        total=Count('id'),
+        confirmadas=Count('id', filter=Q(status=InscricaoStatus.CONFIRMADA)),
+        pendentes=Count('id', filter=Q(status=InscricaoStatus.PENDENTE)),
+        canceladas=Count('id', filter=Q(status=InscricaoStatus.CANCELADA)),
+        com_presenca=Count('id', filter=Q(presenca_confirmada=True)),
+    )
+    
     print(f"\n📊 ESTATÍSTICAS:")
-    print(f"  • Usuários: {Usuario.objects.count()}")
-    print(f"    - ADMIN: {Usuario.objects.filter(perfil=PerfilChoices.ADMIN).count()}")
-    print(f"    - ORGANIZADOR: {Usuario.objects.filter(perfil=PerfilChoices.ORGANIZADOR).count()}")
-    print(f"    - PROFESSOR: {Usuario.objects.filter(perfil=PerfilChoices.PROFESSOR).count()}")
-    print(f"    - ALUNO: {Usuario.objects.filter(perfil=PerfilChoices.ALUNO).count()}")
-    
-    print(f"\n  • Eventos: {Evento.objects.count()}")
-    print(f"    - PALESTRA: {Evento.objects.filter(tipo=TipoEventoChoices.PALESTRA).count()}")
-    print(f"    - WORKSHOP: {Evento.objects.filter(tipo=TipoEventoChoices.WORKSHOP).count()}")
-    print(f"    - MINICURSO: {Evento.objects.filter(tipo=TipoEventoChoices.MINICURSO).count()}")
-    print(f"    - SEMINÁRIO: {Evento.objects.filter(tipo=TipoEventoChoices.SEMINARIO).count()}")
-    print(f"    - OUTRO: {Evento.objects.filter(tipo=TipoEventoChoices.OUTRO).count()}")
-    
-    print(f"\n  • Inscrições: {Inscricao.objects.count()}")
-    print(f"    - CONFIRMADA: {Inscricao.objects.filter(status=InscricaoStatus.CONFIRMADA).count()}")
-    print(f"    - PENDENTE: {Inscricao.objects.filter(status=InscricaoStatus.PENDENTE).count()}")
-    print(f"    - CANCELADA: {Inscricao.objects.filter(status=InscricaoStatus.CANCELADA).count()}")
-    print(f"    - Com presença: {Inscricao.objects.filter(presenca_confirmada=True).count()}")
+    print(f"  • Usuários: {sum(por_perfil.values())}")
+    print(f"    - ADMIN: {por_perfil.get(PerfilChoices.ADMIN, 0)}")
+    print(f"    - ORGANIZADOR: {por_perfil.get(PerfilChoices.ORGANIZADOR, 0)}")
+    print(f"    - PROFESSOR: {por_perfil.get(PerfilChoices.PROFESSOR, 0)}")
+    print(f"    - ALUNO: {por_perfil.get(PerfilChoices.ALUNO, 0)}")
+    
+    print(f"\n  • Eventos: {sum(por_tipo.values())}")
+    print(f"    - PALESTRA: {por_tipo.get(TipoEventoChoices.PALESTRA, 0)}")
+    print(f"    - WORKSHOP: {por_tipo.get(TipoEventoChoices.WORKSHOP, 0)}")
+    print(f"    - MINICURSO: {por_tipo.get(TipoEventoChoices.MINICURSO, 0)}")
+    print(f"    - SEMINÁRIO: {por_tipo.get(TipoEventoChoices.SEMINARIO, 0)}")
+    print(f"    - OUTRO: {por_tipo.get(TipoEventoChoices.OUTRO, 0)}")
+    
+    print(f"\n  • Inscrições: {inscricoes['total']}")
+    print(f"    - CONFIRMADA: {inscricoes['confirmadas']}")
+    print(f"    - PENDENTE: {inscricoes['pendentes']}")
+    print(f"    - CANCELADA: {inscricoes['canceladas']}")
+    print(f"    - Com presença: {inscricoes['com_presenca']}")
     
     print(f"\n  • Certificados: {Certificado.objects.count()}")
     
@@ -580,32 +537,46 @@ def imprimir_resumo():
 
 def main():
     """Função principal."""
+    # Saída em blocos: as linhas de cada fase são gravadas juntas (ver _fase)
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
     print("\n" + "="*70)
     print(" SCRIPT DE POPULAÇÃO DO BANCO DE DADOS")
     print(" Sistema de Gestão de Eventos Acadêmicos (AEGS)")
     print("="*70)
     
     try:
-        # 1. Limpar dados existentes
-        limpar_dados()
-        
-        # 2. Criar usuários
-        usuarios = criar_usuarios()
-        
-        # 3. Criar eventos
-        eventos = criar_eventos(usuarios)
-        
-        # 4. Criar inscrições
-        inscricoes = criar_inscricoes(usuarios, eventos)
-        
-        # 5. Criar certificados
-        certificados = criar_certificados()
+        # Tudo numa única transação: um commit no final, nada pela metade em caso de erro.
+        # Sinais desligados: dados de exemplo não geram registros de auditoria nem e-mails.
+        with desativar_sinais(), transaction.atomic():
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    # Dados de exemplo dispensam durabilidade: o COMMIT não espera o fsync do WAL
+                    cursor.execute("SET LOCAL synchronous_commit = OFF")
+                    # Consultas pequenas: compilar com JIT custaria mais que executá-las
+                    cursor.execute("SET LOCAL jit = off")
+            
+            # 1. Limpar dados existentes
+            limpar_dados()
+            
+            # 2. Criar usuários
+            usuarios = criar_usuarios()
+            
+            # 3. Criar eventos
+            eventos = criar_eventos(usuarios)
+            
+            # 4. Criar inscrições
+            inscricoes = criar_inscricoes(usuarios, eventos)
+            
+            # 5. Criar certificados
+            certificados = criar_certificados(eventos)
         
         # 6. Imprimir resumo
         imprimir_resumo()
         
     except Exception as e:
         print(f"\n❌ ERRO: {e}")
+        sys.stdout.flush()
         import traceback
         traceback.print_exc()
         return 1